@@ -44,6 +44,9 @@ setup(
         'defusedxml>=0.7.1',
     ],
     extras_require={
+        'performance': [
+            'orjson>=3.9.0',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
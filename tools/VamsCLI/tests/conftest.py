@@ -4,10 +4,36 @@ This module provides reusable fixtures for common testing patterns across
 all VamsCLI test files, particularly for ProfileManager and APIClient mocking.
 """
 
+import importlib
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from click.testing import CliRunner
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
+
+
+def _patch_command_module(stack, command_module, profile_manager, api_client):
+    """Patch the names a command module uses to obtain its API client.
+    
+    Modules that call get_api_client_from_context() get that function patched; modules
+    that still build the client themselves get APIClient and
+    get_profile_manager_from_context patched.
+    
+    Returns:
+        dict: The command module patch mocks, keyed like the 'patches' dictionary
+    """
+    module_name = f'vamscli.commands.{command_module}'
+    module = importlib.import_module(module_name)
+    
+    if hasattr(module, 'get_api_client_from_context'):
+        mock_cmd_get_api_client = stack.enter_context(patch(f'{module_name}.get_api_client_from_context'))
+        mock_cmd_get_api_client.return_value = api_client
+        return {'cmd_get_api_client': mock_cmd_get_api_client}
+    
+    mock_cmd_get_pm = stack.enter_context(patch(f'{module_name}.get_profile_manager_from_context'))
+    mock_cmd_api = stack.enter_context(patch(f'{module_name}.APIClient'))
+    mock_cmd_get_pm.return_value = profile_manager
+    mock_cmd_api.return_value = api_client
+    return {'cmd_get_pm': mock_cmd_get_pm, 'cmd_api': mock_cmd_api}
 
 
 @pytest.fixture(autouse=True)
@@ -146,20 +172,20 @@ def generic_command_mocks(mock_profile_manager, mock_api_client):
                 - 'api_client': Mock APIClient instance
                 - 'patches': Dictionary of all patch objects for advanced usage
         """
-        with patch('vamscli.main.ProfileManager') as mock_main_pm, \
+        with ExitStack() as stack, \
+             patch('vamscli.main.ProfileManager') as mock_main_pm, \
              patch('vamscli.utils.decorators.get_profile_manager_from_context') as mock_dec_get_pm, \
-             patch(f'vamscli.commands.{command_module}.get_profile_manager_from_context') as mock_cmd_get_pm, \
-             patch('vamscli.utils.decorators.APIClient') as mock_dec_api, \
-             patch(f'vamscli.commands.{command_module}.APIClient') as mock_cmd_api:
+             patch('vamscli.utils.decorators.APIClient') as mock_dec_api:
             
             # Setup all ProfileManager mocks
             mock_main_pm.return_value = mock_profile_manager
             mock_dec_get_pm.return_value = mock_profile_manager
-            mock_cmd_get_pm.return_value = mock_profile_manager
             
             # Setup all APIClient mocks
             mock_dec_api.return_value = mock_api_client
-            mock_cmd_api.return_value = mock_api_client
+            
+            # Command module mocks
+            cmd_patches = _patch_command_module(stack, command_module, mock_profile_manager, mock_api_client)
             
             yield {
                 'profile_manager': mock_profile_manager,
@@ -167,9 +193,8 @@ def generic_command_mocks(mock_profile_manager, mock_api_client):
                 'patches': {
                     'main_pm': mock_main_pm,
                     'dec_get_pm': mock_dec_get_pm,
-                    'cmd_get_pm': mock_cmd_get_pm,
                     'dec_api': mock_dec_api,
-                    'cmd_api': mock_cmd_api
+                    **cmd_patches
                 }
             }
     
@@ -199,20 +224,20 @@ def no_setup_command_mocks(no_setup_profile_manager, mock_api_client):
         Yields:
             dict: Dictionary with mocks configured for no-setup scenario
         """
-        with patch('vamscli.main.ProfileManager') as mock_main_pm, \
+        with ExitStack() as stack, \
+             patch('vamscli.main.ProfileManager') as mock_main_pm, \
              patch('vamscli.utils.decorators.get_profile_manager_from_context') as mock_dec_get_pm, \
-             patch(f'vamscli.commands.{command_module}.get_profile_manager_from_context') as mock_cmd_get_pm, \
-             patch('vamscli.utils.decorators.APIClient') as mock_dec_api, \
-             patch(f'vamscli.commands.{command_module}.APIClient') as mock_cmd_api:
+             patch('vamscli.utils.decorators.APIClient') as mock_dec_api:
             
             # Setup ProfileManager mocks for no-setup scenario
             mock_main_pm.return_value = no_setup_profile_manager
             mock_dec_get_pm.return_value = no_setup_profile_manager
-            mock_cmd_get_pm.return_value = no_setup_profile_manager
             
             # Setup APIClient mocks
             mock_dec_api.return_value = mock_api_client
-            mock_cmd_api.return_value = mock_api_client
+            
+            # Command module mocks
+            cmd_patches = _patch_command_module(stack, command_module, no_setup_profile_manager, mock_api_client)
             
             yield {
                 'profile_manager': no_setup_profile_manager,
@@ -220,9 +245,8 @@ def no_setup_command_mocks(no_setup_profile_manager, mock_api_client):
                 'patches': {
                     'main_pm': mock_main_pm,
                     'dec_get_pm': mock_dec_get_pm,
-                    'cmd_get_pm': mock_cmd_get_pm,
                     'dec_api': mock_dec_api,
-                    'cmd_api': mock_cmd_api
+                    **cmd_patches
                 }
             }
     
@@ -0,0 +1,83 @@
+"""Test API client transport configuration."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from unittest.mock import Mock, patch
+import requests
+from requests.adapters import HTTPAdapter
+
+from vamscli.constants import HTTP_POOL_MAXSIZE
+from vamscli.utils.api_client import APIClient
+
+
+class TestAPIClientSession:
+    """Test the API client's HTTP session."""
+
+    def test_session_mounts_pooled_adapter(self):
+        """Test that one pooled adapter serves both URL schemes."""
+        client = APIClient("https://api.example.com")
+
+        https_adapter = client.session.get_adapter("https://api.example.com/constraints")
+        http_adapter = client.session.get_adapter("http://api.example.com/constraints")
+
+        assert isinstance(https_adapter, HTTPAdapter)
+        assert https_adapter is http_adapter
+        assert https_adapter._pool_maxsize == HTTP_POOL_MAXSIZE
+
+
+class TestAPIClientResponseParsing:
+    """Test response body parsing."""
+
+    def test_list_cognito_users_parses_content(self):
+        """Test that list responses are parsed from the raw response body."""
+        body = {'Items': [{'userId': 'user@example.com', 'enabled': True}], 'NextToken': 'token1'}
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode('utf-8')
+
+        client = APIClient("https://api.example.com")
+        with patch.object(client, 'get', return_value=response) as mock_get:
+            result = client.list_cognito_users({'pageSize': 50})
+
+        assert result == body
+        mock_get.assert_called_once_with('/user/cognito', include_auth=True, params={'pageSize': 50})
+
+
+class TestAPIClientTokenRefresh:
+    """Test token refresh shared by concurrent requests."""
+
+    def test_concurrent_refresh_runs_once(self):
+        """Test that requests rejected with the same token trigger a single refresh."""
+        auth_profile = {'access_token': 'old-token'}
+        profile_manager = Mock()
+        profile_manager.load_auth_profile.side_effect = lambda: dict(auth_profile)
+        client = APIClient("https://api.example.com", profile_manager)
+
+        def refresh():
+            time.sleep(0.05)
+            auth_profile['access_token'] = 'new-token'
+            return True
+
+        with patch.object(client, '_try_refresh_token', side_effect=refresh) as mock_refresh:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(client._refresh_auth, ['Bearer old-token'] * 4))
+
+        assert results == [True] * 4
+        mock_refresh.assert_called_once()
+
+    def test_refresh_after_rejected_current_token(self):
+        """Test that a rejected current token is refreshed."""
+        profile_manager = Mock()
+        profile_manager.load_auth_profile.return_value = {'access_token': 'token'}
+        client = APIClient("https://api.example.com", profile_manager)
+
+        with patch.object(client, '_try_refresh_token', return_value=False) as mock_refresh:
+            assert client._refresh_auth('Bearer token') is False
+
+        mock_refresh.assert_called_once()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,130 @@
+"""Test helpers shared by the command modules."""
+
+import click
+import pytest
+from unittest.mock import Mock, patch
+
+from vamscli.utils.cli_helpers import format_result_fields, iter_auto_paginate_summary, iter_pages
+from vamscli.utils.decorators import get_api_client_from_context
+
+
+class TestGetApiClientFromContext:
+    """Test the per-invocation API client lookup."""
+
+    def test_cached_per_context(self):
+        """Test that the API client is built once and reused within a Click context."""
+        ctx = click.Context(click.Command('list'), obj={'profile_name': 'default'})
+        with patch('vamscli.utils.decorators.get_profile_manager_from_context') as mock_get_pm, \
+             patch('vamscli.utils.decorators.APIClient') as mock_api_client:
+            mock_get_pm.return_value.load_config.return_value = {'api_gateway_url': 'https://api.example.com'}
+
+            first = get_api_client_from_context(ctx)
+            second = get_api_client_from_context(ctx)
+
+        assert first is second
+        mock_api_client.assert_called_once_with('https://api.example.com', mock_get_pm.return_value)
+        mock_get_pm.return_value.load_config.assert_called_once()
+
+    def test_reuses_validated_config(self):
+        """Test that the configuration loaded by the auth decorator is not loaded again."""
+        ctx = click.Context(click.Command('list'), obj={
+            'profile_name': 'default',
+            'config': {'api_gateway_url': 'https://api.example.com'}
+        })
+        with patch('vamscli.utils.decorators.get_profile_manager_from_context') as mock_get_pm, \
+             patch('vamscli.utils.decorators.APIClient') as mock_api_client:
+            get_api_client_from_context(ctx)
+
+        mock_api_client.assert_called_once_with('https://api.example.com', mock_get_pm.return_value)
+        mock_get_pm.return_value.load_config.assert_not_called()
+
+
+class TestIterPages:
+    """Test the auto-pagination page iterator."""
+
+    def test_follows_tokens_until_last_page(self):
+        """Test that pages are fetched with the previous page's token until none is returned."""
+        fetch = Mock(side_effect=[
+            {'Items': [1, 2], 'NextToken': 'token1'},
+            {'Items': [3]}
+        ])
+
+        pages = list(iter_pages(fetch, 2, 10))
+
+        assert [(page['Items'], count, total, has_more) for page, count, total, has_more in pages] == [
+            ([1, 2], 1, 2, True),
+            ([3], 2, 3, False)
+        ]
+        assert [call.args[0] for call in fetch.call_args_list] == [
+            {'pageSize': 2},
+            {'pageSize': 2, 'startingToken': 'token1'}
+        ]
+
+    def test_stops_at_max_items(self):
+        """Test that no further page is requested once max_items have been fetched."""
+        fetch = Mock(side_effect=[
+            {'Items': [1, 2], 'NextToken': 'token1'},
+            {'Items': [3, 4], 'NextToken': 'token2'},
+            {'Items': [5]}
+        ])
+
+        pages = list(iter_pages(fetch, None, 3))
+
+        assert len(pages) == 2
+        last_page, _, total_fetched, has_more = pages[-1]
+        assert (total_fetched, has_more) == (4, False)
+        assert last_page['NextToken'] == 'token2'
+        assert fetch.call_count == 2
+
+
+class TestIterAutoPaginateSummary:
+    """Test the auto-pagination summary lines."""
+
+    def test_summary_with_note(self):
+        """Test that the note is only shown when present."""
+        data = {'totalItems': 3, 'pageCount': 2}
+
+        assert list(iter_auto_paginate_summary(data)) == ["\nAuto-paginated: Retrieved 3 items in 2 page(s)"]
+        assert list(iter_auto_paginate_summary({**data, 'note': 'More available'}))[-1] == "⚠️  More available"
+
+
+class TestFormatResultFields:
+    """Test the create/update/delete result formatter."""
+
+    FIELDS = (
+        ('Constraint ID', 'constraintId', 'test-constraint'),
+        ('Message', 'message', 'Constraint created'),
+        ('Timestamp', 'timestamp', None),
+        ('Operation', 'operation', None)
+    )
+
+    def test_all_fields(self):
+        """Test that response values are shown in field order."""
+        result = format_result_fields(self.FIELDS, {
+            'message': 'Created', 'timestamp': '2024-01-01T00:00:00', 'operation': 'create'
+        })
+
+        assert result.splitlines() == [
+            "  Constraint ID: test-constraint",
+            "  Message: Created",
+            "  Timestamp: 2024-01-01T00:00:00",
+            "  Operation: create"
+        ]
+
+    def test_defaults_and_optional_fields(self):
+        """Test that defaults fill required fields and empty optional fields are left out."""
+        assert format_result_fields(self.FIELDS, {'operation': ''}) == (
+            "  Constraint ID: test-constraint\n  Message: Constraint created"
+        )
+
+    def test_field_without_key_ignores_response(self):
+        """Test that a field without a response key always shows its default."""
+        fields = (('User ID', None, 'user@example.com'), ('Message', 'message', 'User roles deleted'))
+
+        assert format_result_fields(fields, {'userId': 'other@example.com'}) == (
+            "  User ID: user@example.com\n  Message: User roles deleted"
+        )
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
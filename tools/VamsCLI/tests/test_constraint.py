@@ -11,7 +11,7 @@ from click.testing import CliRunner
 from vamscli.main import cli
 from vamscli.utils.exceptions import (
     ConstraintNotFoundError, ConstraintAlreadyExistsError, ConstraintDeletionError,
-    InvalidConstraintDataError, TemplateImportError, SetupRequiredError
+    InvalidConstraintDataError, TemplateImportError, SetupRequiredError, APIError
 )
 
 
@@ -136,6 +136,107 @@ class TestConstraintListCommand:
             # Verify multiple API calls were made
             assert mocks['api_client'].list_constraints.call_count == 2
 
+    def test_list_auto_paginate_streams_rows(self, cli_runner, constraint_command_mocks):
+        """Test that CLI auto-pagination prints each page's rows before the summary."""
+        with constraint_command_mocks as mocks:
+            mocks['api_client'].list_constraints.side_effect = [
+                {'Items': [{'constraintId': 'constraint1'}], 'NextToken': 'token1'},
+                {'Items': [{'constraintId': 'constraint2'}], 'NextToken': None}
+            ]
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'list',
+                '--auto-paginate'
+            ])
+
+            assert result.exit_code == 0
+            output = result.output
+            assert output.index('Constraint ID: constraint1') < output.index('(page 1)')
+            assert output.index('(page 1)') < output.index('Constraint ID: constraint2')
+            assert output.index('Constraint ID: constraint2') < output.index('Auto-paginated: Retrieved 2 items in 2 page(s)')
+            assert 'Found 2 constraint(s).' in output
+
+    def test_list_auto_paginate_empty(self, cli_runner, constraint_command_mocks):
+        """Test CLI auto-pagination with no constraints."""
+        with constraint_command_mocks as mocks:
+            mocks['api_client'].list_constraints.return_value = {'Items': [], 'NextToken': None}
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'list',
+                '--auto-paginate'
+            ])
+
+            assert result.exit_code == 0
+            assert 'No constraints found.' in result.output
+
+    def test_list_auto_paginate_stops_at_max_items(self, cli_runner, constraint_command_mocks):
+        """Test auto-pagination does not request pages beyond --max-items."""
+        with constraint_command_mocks as mocks:
+            mocks['api_client'].list_constraints.side_effect = [
+                {
+                    'Items': [{'constraintId': f'constraint{i}'} for i in range(1, 6)],
+                    'NextToken': 'token1'
+                },
+                {
+                    'Items': [{'constraintId': f'constraint{i}'} for i in range(6, 11)],
+                    'NextToken': 'token2'
+                }
+            ]
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'list',
+                '--auto-paginate',
+                '--page-size', '5',
+                '--max-items', '5',
+                '--json-output'
+            ])
+
+            assert result.exit_code == 0
+            parsed = json.loads(result.output)
+            assert parsed['totalItems'] == 5
+            assert 'note' in parsed
+            mocks['api_client'].list_constraints.assert_called_once_with({'pageSize': 5})
+
+    def test_list_auto_paginate_throttles_progress(self, cli_runner, constraint_command_mocks):
+        """Test that progress is shown for log-spaced pages and the final page only."""
+        with constraint_command_mocks as mocks:
+            mocks['api_client'].list_constraints.side_effect = [
+                {
+                    'Items': [{'constraintId': f'constraint{page}'}],
+                    'NextToken': f'token{page}' if page < 5 else None
+                }
+                for page in range(1, 6)
+            ]
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'list',
+                '--auto-paginate'
+            ])
+
+            assert result.exit_code == 0
+            assert '(page 1)' in result.output
+            assert '(page 2)' in result.output
+            assert '(page 3)' not in result.output
+            assert '(page 4)' in result.output
+            assert 'Fetched 5 constraints (page 5)' in result.output
+
+    def test_list_auto_paginate_page_error(self, cli_runner, constraint_command_mocks):
+        """Test that an error fetching a later page is propagated."""
+        with constraint_command_mocks as mocks:
+            mocks['api_client'].list_constraints.side_effect = [
+                {'Items': [{'constraintId': 'constraint1'}], 'NextToken': 'token1'},
+                APIError("Server error")
+            ]
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'list',
+                '--auto-paginate'
+            ])
+
+            assert result.exit_code == 1
+            assert isinstance(result.exception, APIError)
+            assert mocks['api_client'].list_constraints.call_count == 2
+
     def test_list_manual_pagination(self, cli_runner, constraint_command_mocks):
         """Test constraint list with manual pagination."""
         with constraint_command_mocks as mocks:
@@ -254,6 +355,36 @@ class TestConstraintGetCommand:
             assert parsed['constraintId'] == 'test-constraint'
             assert parsed['name'] == 'Test Constraint'
 
+    def test_get_json_output_skips_cli_formatter(self, cli_runner, constraint_command_mocks):
+        """Test that the CLI formatter is never invoked in JSON output mode."""
+        with constraint_command_mocks as mocks, \
+             patch('vamscli.commands.roleUserConstraints.format_constraint_output') as mock_formatter:
+            mocks['api_client'].get_constraint.return_value = {'constraintId': 'test-constraint'}
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'get',
+                '-c', 'test-constraint',
+                '--json-output'
+            ])
+
+            assert result.exit_code == 0
+            assert json.loads(result.output)['constraintId'] == 'test-constraint'
+            mock_formatter.assert_not_called()
+
+    def test_list_json_output_skips_cli_formatter(self, cli_runner, constraint_command_mocks):
+        """Test that the list formatter is never invoked in JSON output mode."""
+        with constraint_command_mocks as mocks, \
+             patch('vamscli.commands.roleUserConstraints.format_constraints_list') as mock_formatter:
+            mocks['api_client'].list_constraints.return_value = {
+                'Items': [{'constraintId': 'constraint1'}]
+            }
+
+            result = cli_runner.invoke(cli, ['role', 'constraint', 'list', '--json-output'])
+
+            assert result.exit_code == 0
+            assert json.loads(result.output)['Items'][0]['constraintId'] == 'constraint1'
+            mock_formatter.assert_not_called()
+
 
 class TestConstraintCreateCommand:
     """Test role constraint create command."""
@@ -544,6 +675,39 @@ class TestConstraintUpdateCommand:
 
             assert result.exit_code == 1
             assert 'At least one field must be provided' in result.output
+            mocks['api_client'].get_constraint.assert_not_called()
+
+    def test_update_all_basic_fields_preserves_criteria(self, cli_runner, constraint_command_mocks):
+        """Test that a full basic-field update still merges into the existing constraint."""
+        with constraint_command_mocks as mocks:
+            existing_criteria = [{'field': 'databaseId', 'operator': 'equals', 'value': 'db1'}]
+            mocks['api_client'].get_constraint.return_value = {
+                'constraintId': 'test-constraint',
+                'name': 'Old Name',
+                'description': 'Old description',
+                'objectType': 'asset',
+                'criteriaAnd': existing_criteria
+            }
+            mocks['api_client'].update_constraint.return_value = {
+                'success': True,
+                'message': 'Constraint updated',
+                'constraintId': 'test-constraint'
+            }
+
+            result = cli_runner.invoke(cli, [
+                'role', 'constraint', 'update',
+                '-c', 'test-constraint',
+                '--name', 'New Name',
+                '--description', 'New description',
+                '--object-type', 'database'
+            ])
+
+            assert result.exit_code == 0
+            mocks['api_client'].get_constraint.assert_called_once_with('test-constraint')
+            sent = mocks['api_client'].update_constraint.call_args[0][1]
+            assert sent['name'] == 'New Name'
+            assert sent['objectType'] == 'database'
+            assert sent['criteriaAnd'] == existing_criteria
 
     def test_update_no_setup(self, cli_runner, constraint_no_setup_mocks):
         """Test constraint update without setup."""
@@ -620,13 +784,18 @@ class TestConstraintDeleteCommand:
 
             assert result.exit_code == 0
             assert '✓ Constraint deleted successfully!' in result.output
+            assert '  Constraint ID: test-constraint\n' in result.output
+            assert '  Message: Constraint deleted successfully\n' in result.output
+            assert '  Timestamp: 2024-01-01T00:00:00Z' in result.output
+            assert 'Operation:' not in result.output
 
             # Verify API call
             mocks['api_client'].delete_constraint.assert_called_once_with('test-constraint')
 
     def test_delete_no_confirm_flag(self, cli_runner, constraint_command_mocks):
         """Test constraint delete without confirm flag."""
-        with constraint_command_mocks as mocks:
+        with constraint_command_mocks as mocks, \
+             patch('vamscli.commands.roleUserConstraints.get_api_client_from_context') as mock_get_api_client:
             result = cli_runner.invoke(cli, [
                 'role', 'constraint', 'delete',
                 '-c', 'test-constraint'
@@ -636,8 +805,9 @@ class TestConstraintDeleteCommand:
             assert 'Confirmation required' in result.output
             assert 'Use --confirm flag' in result.output
 
-            # Verify API was not called
+            # Verify API was not called and no client was built
             mocks['api_client'].delete_constraint.assert_not_called()
+            mock_get_api_client.assert_not_called()
 
     def test_delete_cancelled_prompt(self, cli_runner, constraint_command_mocks):
         """Test constraint delete cancelled at confirmation prompt."""
@@ -751,6 +921,77 @@ class TestConstraintUtilityFunctions:
         parsed = json.loads(result)
         assert parsed['constraintId'] == 'test-constraint'
 
+    def test_format_constraints_list(self):
+        """Test constraints list formatting."""
+        from vamscli.commands.roleUserConstraints import format_constraints_list
+
+        data = {
+            'Items': [
+                {
+                    'constraintId': 'constraint1',
+                    'name': 'First',
+                    'criteriaAnd': [{'field': 'databaseId', 'operator': 'equals', 'value': 'db1'}]
+                },
+                {'constraintId': 'constraint2', 'name': 'Second'}
+            ],
+            'NextToken': 'next-token'
+        }
+
+        result = format_constraints_list(data)
+
+        assert result.startswith('Found 2 constraint(s):')
+        assert 'Constraint ID: constraint1' in result
+        assert 'Criteria AND: 1 condition(s)' in result
+        assert 'Constraint ID: constraint2' in result
+        assert result.count('-' * 80) == 3
+        assert 'Next token: next-token' in result
+
+    def test_format_constraints_list_empty(self):
+        """Test constraints list formatting with no items."""
+        from vamscli.commands.roleUserConstraints import format_constraints_list
+
+        assert format_constraints_list({'Items': []}) == "No constraints found."
+
+    def test_validate_template_data(self):
+        """Test single-pass template validation."""
+        from vamscli.commands.roleUserConstraints import _validate_template_data
+
+        valid = {'variableValues': {'ROLE_NAME': 'admin'}, 'constraints': [{'name': 'c1'}]}
+        assert _validate_template_data(valid) is None
+
+        cases = [
+            ({'constraints': [{}]}, "Missing 'variableValues' field"),
+            ({'variableValues': None, 'constraints': [{}]}, "Missing 'variableValues' field"),
+            ({'variableValues': {'DATABASE_ID': 'db1'}, 'constraints': [{}]}, "Missing 'ROLE_NAME' in variableValues"),
+            ({'variableValues': ['ROLE_NAME'], 'constraints': [{}]}, "Missing 'ROLE_NAME' in variableValues"),
+            ({'variableValues': {'ROLE_NAME': 'admin'}}, "Missing or empty 'constraints' field"),
+            ({'variableValues': {'ROLE_NAME': 'admin'}, 'constraints': []}, "Missing or empty 'constraints' field")
+        ]
+        for template_data, expected in cases:
+            error_message, helpful_message = _validate_template_data(template_data)
+            assert error_message == expected
+            assert helpful_message
+
+    def test_format_import_result(self):
+        """Test template import result formatting."""
+        from vamscli.commands.roleUserConstraints import _format_import_result
+
+        result = _format_import_result('Database Admin', 'test-admin', {
+            'constraintsCreated': 2,
+            'constraintIds': ['uuid-1', 'uuid-2'],
+            'message': 'Imported'
+        })
+
+        assert result.split('\n') == [
+            "  Template: Database Admin",
+            "  Role: test-admin",
+            "  Constraints Created: 2",
+            "  Constraint IDs:",
+            "    - uuid-1",
+            "    - uuid-2",
+            "  Message: Imported"
+        ]
+
 
 class TestConstraintCommandIntegration:
     """Test constraint command integration scenarios."""
@@ -908,6 +1149,7 @@ class TestConstraintTemplateImportCommand:
             assert result.exit_code == 0
             assert 'Constraint template imported successfully!' in result.output
             assert 'Constraints Created: 2' in result.output
+            assert '  Constraint IDs:\n    - uuid-1\n    - uuid-2\n' in result.output
 
             # Verify API call
             mocks['api_client'].import_constraints_template.assert_called_once()
@@ -0,0 +1,157 @@
+"""Test JSON output utilities."""
+
+import contextlib
+import io
+import json
+import pytest
+from unittest.mock import patch
+
+from vamscli.utils import json_output
+from vamscli.utils.json_output import dumps_json, loads_json
+
+
+SAMPLE = {
+    'Items': [
+        {'constraintId': 'constraint1', 'criteriaAnd': [{'field': 'databaseId', 'value': 'db1'}]},
+        {'constraintId': 'constraint2', 'enabled': True, 'count': 3, 'ratio': 0.5, 'note': None}
+    ],
+    'NextToken': 'token1'
+}
+
+
+class TestDumpsJson:
+    """Test the dumps_json serializer."""
+
+    def test_stdlib_fallback_matches_json_dumps(self):
+        """Test that without orjson the output is a standard library document."""
+        with patch.object(json_output, 'HAS_ORJSON', False):
+            assert dumps_json(SAMPLE) == json.dumps(SAMPLE, indent=2)
+            assert dumps_json(SAMPLE, indent=False) == json.dumps(SAMPLE, separators=(',', ':'))
+
+    @pytest.mark.parametrize('indent', [True, False])
+    @pytest.mark.parametrize('data', [
+        SAMPLE,
+        {'roleName': 'Ingénieur', 'description': '設計チーム 🚀'},
+        {'ratio': float('nan'), 'values': [float('inf'), -float('inf'), 1.5]}
+    ])
+    def test_stdlib_fallback_matches_orjson(self, data, indent):
+        """Test that both serializers write the same document, including non-ASCII text and NaN."""
+        pytest.importorskip('orjson')
+
+        with patch.object(json_output, 'HAS_ORJSON', True):
+            with_orjson = dumps_json(data, indent=indent)
+        with patch.object(json_output, 'HAS_ORJSON', False):
+            without_orjson = dumps_json(data, indent=indent)
+
+        assert without_orjson.encode('utf-8') == with_orjson.encode('utf-8')
+
+    @pytest.mark.parametrize('use_orjson', [False, True])
+    def test_escapes_non_ascii_and_writes_nan_as_null(self, use_orjson):
+        """Test that non-ASCII text is written as \\u escapes and NaN as null."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+
+        with patch.object(json_output, 'HAS_ORJSON', use_orjson):
+            result = dumps_json({'roleName': 'Ingénieur 🚀', 'ratio': float('nan')}, indent=False)
+
+        assert result == '{"roleName":"Ing\\u00e9nieur \\ud83d\\ude80","ratio":null}'
+        assert json.loads(result)['roleName'] == 'Ingénieur 🚀'
+
+    def test_orjson_round_trip(self):
+        """Test that orjson output parses back to the same data."""
+        pytest.importorskip('orjson')
+
+        with patch.object(json_output, 'HAS_ORJSON', True):
+            result = dumps_json(SAMPLE)
+
+        assert isinstance(result, str)
+        assert json.loads(result) == SAMPLE
+        assert '\n  "Items"' in result
+
+    def test_orjson_unsupported_value_falls_back(self):
+        """Test that values orjson rejects are serialized by the standard library."""
+        pytest.importorskip('orjson')
+
+        data = {1: 'non-string key'}
+        with patch.object(json_output, 'HAS_ORJSON', True):
+            assert dumps_json(data) == json.dumps(data, indent=2)
+
+    def test_unserializable_value_raises(self):
+        """Test that values neither serializer supports still raise TypeError."""
+        with pytest.raises(TypeError):
+            dumps_json({'value': object()})
+
+
+class TestOutputResult:
+    """Test JSON-mode output_result."""
+
+    @pytest.mark.parametrize('use_orjson', [False, True])
+    def test_json_output_writes_document(self, use_orjson, capsys):
+        """Test that JSON mode writes one indented document and a trailing newline."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+
+        with patch.object(json_output, 'HAS_ORJSON', use_orjson):
+            json_output.output_result(SAMPLE, json_output=True)
+
+        out = capsys.readouterr().out
+        assert out.endswith('}\n')
+        assert json.loads(out) == SAMPLE
+        assert '\n  "Items"' in out
+
+    @pytest.mark.parametrize('use_orjson', [False, True])
+    def test_json_output_to_text_stream(self, use_orjson):
+        """Test that JSON mode works when stdout is a text stream without a binary buffer."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+
+        buffer = io.StringIO()
+        with patch.object(json_output, 'HAS_ORJSON', use_orjson):
+            with contextlib.redirect_stdout(buffer):
+                json_output.output_result(SAMPLE, json_output=True)
+
+        assert json.loads(buffer.getvalue()) == SAMPLE
+
+    @pytest.mark.parametrize('use_orjson', [False, True])
+    def test_json_output_to_non_utf8_stream(self, use_orjson):
+        """Test that non-ASCII results can be written to a stdout that is not UTF-8."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+
+        data = {'roleName': '設計チーム', 'description': 'Ingénieur'}
+        buffer = io.TextIOWrapper(io.BytesIO(), encoding='cp1252')
+        with patch.object(json_output, 'HAS_ORJSON', use_orjson):
+            with contextlib.redirect_stdout(buffer):
+                json_output.output_result(data, json_output=True)
+
+        buffer.flush()
+        assert json.loads(buffer.buffer.getvalue().decode('cp1252')) == data
+
+
+class TestLoadsJson:
+    """Test the loads_json parser."""
+
+    @pytest.mark.parametrize('use_orjson', [False, True])
+    def test_parses_str_and_bytes(self, use_orjson):
+        """Test that strings and UTF-8 bytes parse to the same data."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+
+        document = json.dumps(SAMPLE)
+        with patch.object(json_output, 'HAS_ORJSON', use_orjson):
+            assert loads_json(document) == SAMPLE
+            assert loads_json(document.encode('utf-8')) == SAMPLE
+
+    @pytest.mark.parametrize('use_orjson', [False, True])
+    def test_invalid_json_raises_json_decode_error(self, use_orjson):
+        """Test that both parsers raise the standard library's decode error."""
+        if use_orjson:
+            pytest.importorskip('orjson')
+
+        with patch.object(json_output, 'HAS_ORJSON', use_orjson):
+            with pytest.raises(json.JSONDecodeError):
+                loads_json('{not json')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
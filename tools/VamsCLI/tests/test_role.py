@@ -1,6 +1,7 @@
 """Test role management functionality."""
 
 import json
+import click
 import pytest
 from unittest.mock import Mock, patch
 from click.testing import CliRunner
@@ -164,6 +165,28 @@ class TestRoleListCommand:
             # Verify two API calls were made
             assert mocks['api_client'].list_roles.call_count == 2
     
+    def test_list_auto_paginate_throttles_progress(self, cli_runner, role_command_mocks):
+        """Test that progress is shown for log-spaced pages and the final page only."""
+        with role_command_mocks as mocks:
+            mocks['api_client'].list_roles.side_effect = [
+                {
+                    'message': {
+                        'Items': [{'roleName': f'role{page}', 'description': 'Role', 'mfaRequired': False}],
+                        'NextToken': f'token{page}' if page < 5 else None
+                    }
+                }
+                for page in range(1, 6)
+            ]
+            
+            result = cli_runner.invoke(cli, ['role', 'list', '--auto-paginate'])
+            
+            assert result.exit_code == 0
+            assert '(page 1)' in result.output
+            assert '(page 2)' in result.output
+            assert '(page 3)' not in result.output
+            assert '(page 4)' in result.output
+            assert 'Fetched 5 roles (page 5)' in result.output
+    
     def test_list_manual_paginate(self, cli_runner, role_command_mocks):
         """Test role listing with manual pagination."""
         with role_command_mocks as mocks:
@@ -607,28 +630,38 @@ class TestRoleDeleteCommand:
             # Verify API call
             mocks['api_client'].delete_role.assert_called_once_with('old-role')
     
-    def test_delete_no_confirm_flag(self, cli_runner, role_command_mocks):
-        """Test deletion without confirm flag."""
+    @patch('vamscli.commands.roleUserConstraints.stdin_is_interactive', return_value=True)
+    @patch('click.confirm')
+    def test_delete_no_confirm_flag_prompts(self, mock_confirm, mock_interactive, cli_runner, role_command_mocks):
+        """Test deletion without confirm flag prompts once and proceeds when accepted."""
+        mock_confirm.return_value = True
+        
         with role_command_mocks as mocks:
+            mocks['api_client'].delete_role.return_value = {
+                'message': 'success'
+            }
+            
             result = cli_runner.invoke(cli, [
                 'role', 'delete',
                 '-r', 'admin'
             ])
             
-            assert result.exit_code == 1
-            assert 'Role deletion requires explicit confirmation' in result.output
-            assert 'Use --confirm flag' in result.output
+            assert result.exit_code == 0
+            assert "You are about to delete role 'admin'" in result.output
+            assert '✓ Role deleted successfully!' in result.output
+            mock_confirm.assert_called_once()
+            mocks['api_client'].delete_role.assert_called_once_with('admin')
     
+    @patch('vamscli.commands.roleUserConstraints.stdin_is_interactive', return_value=True)
     @patch('click.confirm')
-    def test_delete_cancelled_at_prompt(self, mock_confirm, cli_runner, role_command_mocks):
+    def test_delete_cancelled_at_prompt(self, mock_confirm, mock_interactive, cli_runner, role_command_mocks):
         """Test deletion cancelled at confirmation prompt."""
         mock_confirm.return_value = False
         
         with role_command_mocks as mocks:
             result = cli_runner.invoke(cli, [
                 'role', 'delete',
-                '-r', 'admin',
-                '--confirm'
+                '-r', 'admin'
             ])
             
             assert result.exit_code == 0
@@ -637,6 +670,61 @@ class TestRoleDeleteCommand:
             # Verify API was not called
             mocks['api_client'].delete_role.assert_not_called()
     
+    @patch('vamscli.commands.roleUserConstraints.stdin_is_interactive', return_value=False)
+    @patch('click.confirm')
+    def test_delete_no_confirm_flag_non_interactive(self, mock_confirm, mock_interactive, cli_runner,
+                                                    role_command_mocks):
+        """Test that without a terminal the --confirm flag is required and no prompt is shown."""
+        with role_command_mocks as mocks:
+            result = cli_runner.invoke(cli, [
+                'role', 'delete',
+                '-r', 'admin'
+            ])
+            
+            assert result.exit_code == 1
+            assert 'Confirmation required for role deletion' in result.output
+            assert 'Use --confirm flag' in result.output
+            mock_confirm.assert_not_called()
+            mocks['api_client'].delete_role.assert_not_called()
+    
+    @patch('click.confirm')
+    def test_delete_confirm_flag_skips_prompt(self, mock_confirm, cli_runner, role_command_mocks):
+        """Test that --confirm and --yes skip the interactive prompt."""
+        with role_command_mocks as mocks:
+            mocks['api_client'].delete_role.return_value = {
+                'message': 'success'
+            }
+            
+            for flag in ('--confirm', '--yes'):
+                result = cli_runner.invoke(cli, [
+                    'role', 'delete',
+                    '-r', 'old-role',
+                    flag
+                ])
+                
+                assert result.exit_code == 0
+                assert '✓ Role deleted successfully!' in result.output
+            
+            mock_confirm.assert_not_called()
+            assert mocks['api_client'].delete_role.call_count == 2
+    
+    @patch('click.confirm')
+    def test_delete_json_output_requires_confirm(self, mock_confirm, cli_runner, role_command_mocks):
+        """Test that JSON mode never prompts and requires --confirm."""
+        with role_command_mocks as mocks:
+            result = cli_runner.invoke(cli, [
+                'role', 'delete',
+                '-r', 'admin',
+                '--json-output'
+            ])
+            
+            assert result.exit_code == 1
+            parsed = json.loads(result.output)
+            assert parsed['error'] == 'Confirmation required'
+            assert parsed['roleName'] == 'admin'
+            mock_confirm.assert_not_called()
+            mocks['api_client'].delete_role.assert_not_called()
+    
     @patch('click.confirm')
     def test_delete_not_found(self, mock_confirm, cli_runner, role_command_mocks):
         """Test deleting a non-existent role."""
@@ -691,6 +779,24 @@ class TestRoleDeleteCommand:
             assert result.exception
             assert isinstance(result.exception, SetupRequiredError)
     
+    @patch('vamscli.commands.roleUserConstraints.stdin_is_interactive', return_value=True)
+    @patch('click.confirm')
+    def test_delete_no_setup_checked_before_prompt(self, mock_confirm, mock_interactive, cli_runner,
+                                                   role_no_setup_mocks):
+        """Test that an unconfigured profile fails before the user is asked to confirm."""
+        from vamscli.utils.exceptions import SetupRequiredError
+        
+        with role_no_setup_mocks:
+            result = cli_runner.invoke(cli, [
+                'role', 'delete',
+                '-r', 'admin'
+            ])
+            
+            assert result.exit_code == 1
+            assert isinstance(result.exception, SetupRequiredError)
+            assert "You are about to delete role" not in result.output
+            mock_confirm.assert_not_called()
+    
     @patch('click.confirm')
     def test_delete_json_output(self, mock_confirm, cli_runner, role_command_mocks):
         """Test role deletion with JSON output."""
@@ -742,6 +848,52 @@ class TestRoleUtilityFunctions:
         result = parse_json_input(None)
         assert result == {}
     
+    def test_parse_json_input_file(self, tmp_path):
+        """Test parsing JSON from a file path."""
+        from vamscli.commands.roleUserConstraints import parse_json_input
+        
+        json_file = tmp_path / 'role.json'
+        json_file.write_text('{"roleName": "admin"}')
+        
+        assert parse_json_input(str(json_file)) == {'roleName': 'admin'}
+    
+    def test_parse_json_input_invalid(self, tmp_path):
+        """Test that invalid inline JSON and invalid JSON files are rejected."""
+        from vamscli.commands.roleUserConstraints import parse_json_input
+        
+        with pytest.raises(click.BadParameter, match='neither valid JSON nor a readable file path'):
+            parse_json_input('{not json')
+        
+        bad_file = tmp_path / 'bad.json'
+        bad_file.write_text('{not json')
+        with pytest.raises(click.BadParameter, match='file contains invalid JSON format'):
+            parse_json_input(str(bad_file))
+    
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_parse_json_input_invalid_utf8_file(self, tmp_path, has_orjson):
+        """Test that a file that is not UTF-8 is rejected with or without orjson."""
+        from vamscli.commands.roleUserConstraints import parse_json_input
+        from vamscli.utils import json_output
+        
+        if has_orjson and not json_output.HAS_ORJSON:
+            pytest.skip("orjson is not installed")
+        
+        latin1_file = tmp_path / 'latin1.json'
+        latin1_file.write_bytes('{"roleName": "caf\u00e9"}'.encode('latin-1'))
+        with patch.object(json_output, 'HAS_ORJSON', has_orjson):
+            with pytest.raises(click.BadParameter, match='file contains invalid JSON format'):
+                parse_json_input(str(latin1_file))
+    
+    def test_parse_json_input_click_sentinel(self):
+        """Test that Click's UNSET sentinel is treated as no input."""
+        click_utils = pytest.importorskip('click._utils')
+        from vamscli.commands.roleUserConstraints import parse_json_input
+        
+        if not hasattr(click_utils, 'UNSET'):
+            pytest.skip("Click version has no UNSET sentinel")
+        
+        assert parse_json_input(click_utils.UNSET) == {}
+    
     def test_format_role_output(self):
         """Test formatting role output for CLI."""
         from vamscli.commands.roleUserConstraints import format_role_output
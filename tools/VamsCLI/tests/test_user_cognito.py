@@ -1,6 +1,7 @@
 """Test Cognito user management functionality."""
 
 import json
+import click
 import pytest
 from unittest.mock import Mock, patch
 from click.testing import CliRunner
@@ -10,7 +11,8 @@ from vamscli.utils.exceptions import (
     CognitoUserNotFoundError,
     CognitoUserAlreadyExistsError,
     InvalidCognitoUserDataError,
-    CognitoUserOperationError
+    CognitoUserOperationError,
+    RateLimitExceededError
 )
 
 
@@ -158,6 +160,84 @@ class TestUserCognitoListCommand:
             # Verify two API calls were made
             assert mocks['api_client'].list_cognito_users.call_count == 2
 
+    def test_list_auto_paginate_streams_rows(self, cli_runner, user_command_mocks):
+        """Test that CLI auto-pagination prints each page's rows before the summary."""
+        with user_command_mocks as mocks:
+            mocks['api_client'].list_cognito_users.side_effect = [
+                {'Items': [{'userId': 'user1@example.com', 'email': 'user1@example.com'}], 'NextToken': 'token-page-2'},
+                {'Items': [{'userId': 'user2@example.com', 'email': 'user2@example.com'}]}
+            ]
+
+            result = cli_runner.invoke(cli, ['user', 'cognito', 'list', '--auto-paginate'])
+
+            assert result.exit_code == 0
+            output = result.output
+            assert output.index('User ID: user1@example.com') < output.index('(page 1)')
+            assert output.index('(page 1)') < output.index('User ID: user2@example.com')
+            assert output.index('User ID: user2@example.com') < output.index('Auto-paginated')
+            assert 'Found 2 Cognito user(s).' in output
+
+    def test_list_auto_paginate_empty(self, cli_runner, user_command_mocks):
+        """Test CLI auto-pagination with no users."""
+        with user_command_mocks as mocks:
+            mocks['api_client'].list_cognito_users.return_value = {'Items': []}
+
+            result = cli_runner.invoke(cli, ['user', 'cognito', 'list', '--auto-paginate'])
+
+            assert result.exit_code == 0
+            assert 'No Cognito users found.' in result.output
+            assert 'Auto-paginated' not in result.output
+
+    def test_list_auto_paginate_json_output(self, cli_runner, user_command_mocks):
+        """Test that JSON auto-pagination still returns a single document with all items."""
+        with user_command_mocks as mocks:
+            mocks['api_client'].list_cognito_users.side_effect = [
+                {'Items': [{'userId': 'user1@example.com'}], 'NextToken': 'token-page-2'},
+                {'Items': [{'userId': 'user2@example.com'}]}
+            ]
+
+            result = cli_runner.invoke(cli, ['user', 'cognito', 'list', '--auto-paginate', '--json-output'])
+
+            assert result.exit_code == 0
+            parsed = json.loads(result.output)
+            assert [item['userId'] for item in parsed['Items']] == ['user1@example.com', 'user2@example.com']
+            assert parsed['totalItems'] == 2
+            assert parsed['pageCount'] == 2
+
+    def test_list_auto_paginate_stops_at_max_items(self, cli_runner, user_command_mocks):
+        """Test that auto-pagination does not prefetch a page past max-items."""
+        with user_command_mocks as mocks:
+            mocks['api_client'].list_cognito_users.return_value = {
+                'Items': [{'userId': 'user1@example.com'}, {'userId': 'user2@example.com'}],
+                'NextToken': 'token-page-2'
+            }
+
+            result = cli_runner.invoke(cli, [
+                'user', 'cognito', 'list',
+                '--auto-paginate', '--max-items', '2'
+            ])
+
+            assert result.exit_code == 0
+            assert 'Reached maximum of 2 items' in result.output
+            mocks['api_client'].list_cognito_users.assert_called_once_with({})
+
+    def test_list_auto_paginate_page_error(self, cli_runner, user_command_mocks):
+        """Test that an error on a prefetched page is reported."""
+        with user_command_mocks as mocks:
+            mocks['api_client'].list_cognito_users.side_effect = [
+                {'Items': [{'userId': 'user1@example.com'}], 'NextToken': 'token-page-2'},
+                CognitoUserOperationError("Page fetch failed")
+            ]
+
+            result = cli_runner.invoke(cli, [
+                'user', 'cognito', 'list',
+                '--auto-paginate'
+            ])
+
+            assert result.exit_code == 1
+            assert 'Page fetch failed' in result.output
+            mocks['api_client'].list_cognito_users.assert_any_call({'startingToken': 'token-page-2'})
+
     def test_list_json_output(self, cli_runner, user_command_mocks):
         """Test list with JSON output."""
         with user_command_mocks as mocks:
@@ -296,6 +376,33 @@ class TestUserCognitoCreateCommand:
             assert 'User Already Exists' in result.output
             assert 'User already exists' in result.output
 
+    def test_create_upsert_existing_user(self, cli_runner, user_command_mocks):
+        """Test that --upsert updates a user that already exists."""
+        with user_command_mocks as mocks:
+            mocks['api_client'].create_cognito_user.side_effect = CognitoUserAlreadyExistsError(
+                "User already exists"
+            )
+            mocks['api_client'].update_cognito_user.return_value = {
+                'success': True,
+                'message': 'User updated successfully',
+                'userId': 'user@example.com',
+                'operation': 'update'
+            }
+
+            result = cli_runner.invoke(cli, [
+                'user', 'cognito', 'create',
+                '-u', 'user@example.com',
+                '-e', 'user@example.com',
+                '-p', '+12345678900',
+                '--upsert'
+            ])
+
+            assert result.exit_code == 0
+            assert '✓ Cognito user updated successfully!' in result.output
+            mocks['api_client'].update_cognito_user.assert_called_once_with(
+                'user@example.com', {'email': 'user@example.com', 'phone': '+12345678900'}
+            )
+
     def test_create_invalid_data(self, cli_runner, user_command_mocks):
         """Test create with invalid user data."""
         with user_command_mocks as mocks:
@@ -348,6 +455,104 @@ class TestUserCognitoCreateCommand:
         assert 'Missing option' in result.output or 'required' in result.output.lower()
 
 
+class TestUserCognitoCreateBatchCommand:
+    """Test user cognito create-batch command."""
+
+    def test_create_batch_help(self, cli_runner):
+        """Test create-batch command help."""
+        result = cli_runner.invoke(cli, ['user', 'cognito', 'create-batch', '--help'])
+        assert result.exit_code == 0
+        assert 'Create multiple Cognito users' in result.output
+        assert '--file' in result.output
+
+    def test_create_batch_success(self, cli_runner, user_command_mocks, tmp_path):
+        """Test creating every user in a batch file."""
+        batch_file = tmp_path / 'users.json'
+        batch_file.write_text(json.dumps([
+            {'userId': 'user1@example.com', 'email': 'user1@example.com'},
+            {'userId': 'user2@example.com', 'email': 'user2@example.com', 'phone': '+12345678900'}
+        ]))
+
+        with user_command_mocks as mocks:
+            mocks['api_client'].create_cognito_user.side_effect = lambda data: {'userId': data['userId']}
+
+            result = cli_runner.invoke(cli, ['user', 'cognito', 'create-batch', '-f', str(batch_file)])
+
+            assert result.exit_code == 0
+            assert 'Created: 2 of 2' in result.output
+            assert mocks['api_client'].create_cognito_user.call_count == 2
+            mocks['api_client'].create_cognito_user.assert_any_call(
+                {'userId': 'user2@example.com', 'email': 'user2@example.com', 'phone': '+12345678900'}
+            )
+
+    def test_create_batch_partial_failure(self, cli_runner, user_command_mocks, tmp_path):
+        """Test that one failed user is reported without stopping the others."""
+        batch_file = tmp_path / 'users.json'
+        batch_file.write_text(json.dumps([
+            {'userId': 'user1@example.com', 'email': 'user1@example.com'},
+            {'userId': 'user2@example.com', 'email': 'user2@example.com'}
+        ]))
+
+        def create_user(data):
+            if data['userId'] == 'user1@example.com':
+                raise CognitoUserAlreadyExistsError("User already exists")
+            return {'userId': data['userId']}
+
+        with user_command_mocks as mocks:
+            mocks['api_client'].create_cognito_user.side_effect = create_user
+
+            result = cli_runner.invoke(cli, [
+                'user', 'cognito', 'create-batch', '-f', str(batch_file), '--json-output'
+            ])
+
+            assert result.exit_code == 1
+            parsed = json.loads(result.stdout)
+            assert parsed['succeeded'] == 1
+            assert parsed['failed'] == 1
+            assert [entry['userId'] for entry in parsed['results']] == ['user1@example.com', 'user2@example.com']
+            assert 'User already exists' in parsed['results'][0]['error']
+
+    def test_create_batch_infrastructure_error(self, cli_runner, user_command_mocks, tmp_path):
+        """Test that an infrastructure error for one user still reports every user."""
+        batch_file = tmp_path / 'users.json'
+        batch_file.write_text(json.dumps([
+            {'userId': 'user1@example.com', 'email': 'user1@example.com'},
+            {'userId': 'user2@example.com', 'email': 'user2@example.com'},
+            {'userId': 'user3@example.com', 'email': 'user3@example.com'}
+        ]))
+
+        def create_user(data):
+            if data['userId'] == 'user2@example.com':
+                raise RateLimitExceededError("Rate limit exceeded")
+            return {'userId': data['userId']}
+
+        with user_command_mocks as mocks:
+            mocks['api_client'].create_cognito_user.side_effect = create_user
+
+            result = cli_runner.invoke(cli, [
+                'user', 'cognito', 'create-batch', '-f', str(batch_file), '--json-output'
+            ])
+
+            assert result.exit_code == 1
+            assert not isinstance(result.exception, RateLimitExceededError)
+            parsed = json.loads(result.stdout)
+            assert parsed['succeeded'] == 2
+            assert [entry['success'] for entry in parsed['results']] == [True, False, True]
+            assert 'Rate limit exceeded' in parsed['results'][1]['error']
+
+    def test_create_batch_invalid_entry(self, cli_runner, user_command_mocks, tmp_path):
+        """Test that an entry without an email is rejected before any API call."""
+        batch_file = tmp_path / 'users.json'
+        batch_file.write_text(json.dumps([{'userId': 'user1@example.com'}]))
+
+        with user_command_mocks as mocks:
+            result = cli_runner.invoke(cli, ['user', 'cognito', 'create-batch', '-f', str(batch_file)])
+
+            assert result.exit_code == 2
+            assert "Batch entry 1 must be an object with 'userId' and 'email'" in result.output
+            mocks['api_client'].create_cognito_user.assert_not_called()
+
+
 class TestUserCognitoUpdateCommand:
     """Test user cognito update command."""
 
@@ -543,7 +748,8 @@ class TestUserCognitoDeleteCommand:
 
     def test_delete_cancelled_at_prompt(self, cli_runner, user_command_mocks):
         """Test delete cancelled at confirmation prompt."""
-        with user_command_mocks as mocks:
+        with user_command_mocks as mocks, \
+             patch('vamscli.commands.user.stdin_is_interactive', return_value=True):
             result = cli_runner.invoke(cli, [
                 'user', 'cognito', 'delete',
                 '-u', 'user@example.com',
@@ -556,6 +762,27 @@ class TestUserCognitoDeleteCommand:
             # Verify API was not called
             mocks['api_client'].delete_cognito_user.assert_not_called()
 
+    def test_delete_non_interactive_skips_prompt(self, cli_runner, user_command_mocks):
+        """Test that --confirm deletes without prompting when stdin is not a terminal."""
+        with user_command_mocks as mocks, \
+             patch('vamscli.commands.user.stdin_is_interactive', return_value=False):
+            mocks['api_client'].delete_cognito_user.return_value = {
+                'success': True,
+                'message': 'User deleted successfully',
+                'userId': 'user@example.com'
+            }
+
+            result = cli_runner.invoke(cli, [
+                'user', 'cognito', 'delete',
+                '-u', 'user@example.com',
+                '--confirm'
+            ])
+
+            assert result.exit_code == 0
+            assert 'Are you sure' not in result.output
+            assert '✓ Cognito user deleted successfully!' in result.output
+            mocks['api_client'].delete_cognito_user.assert_called_once_with('user@example.com')
+
     def test_delete_user_not_found(self, cli_runner, user_command_mocks):
         """Test delete when user not found."""
         with user_command_mocks as mocks:
@@ -733,11 +960,67 @@ class TestUserCognitoCommandGroup:
         assert 'Cognito user management commands' in result.output
         assert 'list' in result.output
         assert 'create' in result.output
+        assert 'create-batch' in result.output
         assert 'update' in result.output
         assert 'delete' in result.output
         assert 'reset-password' in result.output
 
 
+class TestUserCognitoHelpers:
+    """Test module-level helpers of the user cognito commands."""
+
+    def test_format_user_row(self):
+        """Test that a user row includes optional fields only when present."""
+        from vamscli.commands.user import _format_user_row
+
+        full = _format_user_row({
+            'userId': 'user@example.com',
+            'email': 'user@example.com',
+            'phone': '+12345678900',
+            'userStatus': 'CONFIRMED',
+            'enabled': True,
+            'mfaEnabled': False,
+            'userCreateDate': '2024-01-01T00:00:00Z',
+            'userLastModifiedDate': '2024-01-02T00:00:00Z'
+        })
+        assert full.split('\n') == [
+            'User ID: user@example.com',
+            'Email: user@example.com',
+            'Phone: +12345678900',
+            'Status: CONFIRMED',
+            'Enabled: True',
+            'MFA Enabled: False',
+            'Created: 2024-01-01T00:00:00Z',
+            'Last Modified: 2024-01-02T00:00:00Z',
+            '-' * 80
+        ]
+
+        minimal = _format_user_row({})
+        assert minimal.split('\n') == [
+            'User ID: N/A',
+            'Email: N/A',
+            'Status: N/A',
+            'Enabled: False',
+            'MFA Enabled: False',
+            '-' * 80
+        ]
+
+    def test_format_users_list(self):
+        """Test users list formatting with a manual pagination token."""
+        from vamscli.commands.user import format_users_list
+
+        result = format_users_list({
+            'Items': [{'userId': 'user1@example.com'}, {'userId': 'user2@example.com'}],
+            'NextToken': 'next-token'
+        })
+
+        assert result.startswith('Found 2 Cognito user(s):')
+        assert result.count('-' * 80) == 3
+        assert 'User ID: user2@example.com' in result
+        assert 'Next token: next-token' in result
+        assert format_users_list({'Items': []}) == "No Cognito users found."
+
+
 class TestUserCognitoErrorHandling:
     """Test error handling across all Cognito user commands."""
 
@@ -182,6 +182,59 @@ class TestUserRoleListCommand:
             # Verify two API calls were made
             assert mocks['api_client'].list_user_roles.call_count == 2
 
+    def test_list_auto_paginate_streams_rows(self, cli_runner, user_role_command_mocks):
+        """Test that CLI auto-pagination prints each page's rows before the summary."""
+        with user_role_command_mocks as mocks:
+            mocks['api_client'].list_user_roles.side_effect = [
+                {'Items': [{'userId': 'user1@example.com', 'roleName': ['admin']}], 'NextToken': 'token-page-2'},
+                {'Items': [{'userId': 'user2@example.com', 'roleName': ['viewer']}]}
+            ]
+
+            result = cli_runner.invoke(cli, ['role', 'user', 'list', '--auto-paginate'])
+
+            assert result.exit_code == 0
+            output = result.output
+            assert output.index('User ID: user1@example.com') < output.index('(page 1)')
+            assert output.index('(page 1)') < output.index('User ID: user2@example.com')
+            assert output.index('User ID: user2@example.com') < output.index('Auto-paginated')
+            assert 'Found 2 user role assignment(s).' in output
+
+    def test_list_auto_paginate_json_output(self, cli_runner, user_role_command_mocks):
+        """Test that JSON auto-pagination still returns a single document with all items."""
+        with user_role_command_mocks as mocks:
+            mocks['api_client'].list_user_roles.side_effect = [
+                {'Items': [{'userId': 'user1@example.com', 'roleName': ['admin']}], 'NextToken': 'token-page-2'},
+                {'Items': [{'userId': 'user2@example.com', 'roleName': ['viewer']}]}
+            ]
+
+            result = cli_runner.invoke(cli, ['role', 'user', 'list', '--auto-paginate', '--json-output'])
+
+            assert result.exit_code == 0
+            parsed = json.loads(result.output)
+            assert [item['userId'] for item in parsed['Items']] == ['user1@example.com', 'user2@example.com']
+            assert parsed['totalItems'] == 2
+            assert parsed['pageCount'] == 2
+
+    def test_list_auto_paginate_throttles_progress(self, cli_runner, user_role_command_mocks):
+        """Test that progress is shown for log-spaced pages and the final page only."""
+        with user_role_command_mocks as mocks:
+            mocks['api_client'].list_user_roles.side_effect = [
+                {
+                    'Items': [{'userId': f'user{page}@example.com', 'roleName': ['viewer']}],
+                    'NextToken': f'token{page}' if page < 5 else None
+                }
+                for page in range(1, 6)
+            ]
+
+            result = cli_runner.invoke(cli, ['role', 'user', 'list', '--auto-paginate'])
+
+            assert result.exit_code == 0
+            assert '(page 1)' in result.output
+            assert '(page 2)' in result.output
+            assert '(page 3)' not in result.output
+            assert '(page 4)' in result.output
+            assert 'Fetched 5 user role assignments (page 5)' in result.output
+
     def test_list_auto_paginate_with_max_items(self, cli_runner, user_role_command_mocks):
         """Test user role list with auto-pagination and max items limit."""
         with user_role_command_mocks as mocks:
@@ -202,6 +255,23 @@ class TestUserRoleListCommand:
 
             assert result.exit_code == 0
             assert 'Reached maximum of 5 items' in result.output
+            
+            # The next page is not prefetched once the limit is reached
+            mocks['api_client'].list_user_roles.assert_called_once_with({})
+
+    def test_list_auto_paginate_page_error(self, cli_runner, user_role_command_mocks):
+        """Test that an error fetching a later page is propagated."""
+        with user_role_command_mocks as mocks:
+            mocks['api_client'].list_user_roles.side_effect = [
+                {'Items': [{'userId': 'user1@example.com', 'roleName': ['admin']}], 'NextToken': 'token1'},
+                APIError("Server error")
+            ]
+
+            result = cli_runner.invoke(cli, ['role', 'user', 'list', '--auto-paginate'])
+
+            assert result.exit_code == 1
+            assert isinstance(result.exception, APIError)
+            assert mocks['api_client'].list_user_roles.call_count == 2
 
     def test_list_conflicting_pagination_options(self, cli_runner, user_role_command_mocks):
         """Test user role list with conflicting pagination options."""
@@ -561,7 +631,8 @@ class TestUserRoleDeleteCommand:
 
             assert result.exit_code == 0
             assert '✓ User roles deleted successfully!' in result.output
-            assert 'user@example.com' in result.output
+            assert '  User ID: user@example.com\n' in result.output
+            assert '  Operation: delete' in result.output
 
             # Verify API call
             mocks['api_client'].delete_user_roles.assert_called_once_with('user@example.com')
@@ -593,7 +664,8 @@ class TestUserRoleDeleteCommand:
 
     def test_delete_cancelled_at_prompt(self, cli_runner, user_role_command_mocks):
         """Test user role delete cancelled at confirmation prompt."""
-        with user_role_command_mocks as mocks:
+        with user_role_command_mocks as mocks, \
+             patch('vamscli.commands.roleUserConstraints.stdin_is_interactive', return_value=True):
             result = cli_runner.invoke(cli, [
                 'role', 'user', 'delete',
                 '-u', 'user@example.com',
@@ -606,6 +678,26 @@ class TestUserRoleDeleteCommand:
             # Verify API was not called
             mocks['api_client'].delete_user_roles.assert_not_called()
 
+    def test_delete_non_interactive_skips_prompt(self, cli_runner, user_role_command_mocks):
+        """Test that --confirm deletes without prompting when stdin is not a terminal."""
+        with user_role_command_mocks as mocks, \
+             patch('vamscli.commands.roleUserConstraints.stdin_is_interactive', return_value=False):
+            mocks['api_client'].delete_user_roles.return_value = {
+                'success': True,
+                'message': 'User roles deleted successfully'
+            }
+
+            result = cli_runner.invoke(cli, [
+                'role', 'user', 'delete',
+                '-u', 'user@example.com',
+                '--confirm'
+            ])
+
+            assert result.exit_code == 0
+            assert 'Are you sure' not in result.output
+            assert '✓ User roles deleted successfully!' in result.output
+            mocks['api_client'].delete_user_roles.assert_called_once_with('user@example.com')
+
     def test_delete_not_found(self, cli_runner, user_role_command_mocks):
         """Test user role delete when user role not found."""
         with user_role_command_mocks as mocks:
@@ -718,6 +810,47 @@ class TestUserRoleUtilityFunctions:
         assert 'user@example.com' in result
         assert 'Roles: (none)' in result
 
+    def test_format_user_role_row(self):
+        """Test the per-row block used by the user role list formatter."""
+        from vamscli.commands.roleUserConstraints import _format_user_role_row
+
+        result = _format_user_role_row({
+            'userId': 'user@example.com',
+            'roleName': ['admin', 'viewer'],
+            'createdOn': '2024-01-01T00:00:00Z'
+        })
+
+        assert result.split('\n') == [
+            'User ID: user@example.com',
+            'Roles (2):',
+            '  [1] admin',
+            '  [2] viewer',
+            'Created On: 2024-01-01T00:00:00Z',
+            '-' * 80
+        ]
+
+    def test_format_user_role_row_null_roles(self):
+        """Test that a null roleName renders as an empty role list."""
+        from vamscli.commands.roleUserConstraints import _format_user_role_row
+
+        result = _format_user_role_row({'userId': 'user@example.com', 'roleName': None})
+
+        assert result.split('\n')[:3] == ['User ID: user@example.com', 'Roles (0):', 'Created On: N/A']
+
+    def test_format_user_roles_list(self):
+        """Test the module-level user roles list formatter."""
+        from vamscli.commands.roleUserConstraints import format_user_roles_list
+
+        result = format_user_roles_list({
+            'Items': [{'userId': 'user@example.com', 'roleName': ['admin']}],
+            'NextToken': 'next-token'
+        })
+
+        assert result.startswith('Found 1 user role assignment(s):')
+        assert 'User ID: user@example.com' in result
+        assert 'Next token: next-token' in result
+        assert format_user_roles_list({'Items': []}) == "No user role assignments found."
+
 
 class TestUserRoleIntegration:
     """Test user role command integration scenarios."""
@@ -1,48 +1,85 @@
 """Role management commands for VamsCLI."""
 
 import json
+import os
+import sys
+from builtins import list as builtin_list  # Avoid namespace collision with 'list' command
+from functools import partial
 import click
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from ..constants import API_ROLES, API_ROLE_BY_ID, API_CONSTRAINTS, API_CONSTRAINT_BY_ID, API_CONSTRAINTS_TEMPLATE_IMPORT
-from ..utils.decorators import requires_setup_and_auth, get_profile_manager_from_context
-from ..utils.api_client import APIClient
-from ..utils.json_output import output_status, output_result, output_error
+from ..utils.decorators import requires_setup_and_auth, get_api_client_from_context
+from ..utils.cli_helpers import (
+    SEPARATOR, iter_pages, iter_auto_paginate_summary, format_result_fields, stdin_is_interactive
+)
+from ..utils.json_output import output_status, output_result, output_error, dumps_json, loads_json
 from ..utils.exceptions import (
     RoleNotFoundError, RoleAlreadyExistsError, RoleDeletionError, InvalidRoleDataError,
     ConstraintNotFoundError, ConstraintAlreadyExistsError, ConstraintDeletionError, InvalidConstraintDataError,
+    UserRoleAlreadyExistsError, UserRoleNotFoundError, UserRoleDeletionError, InvalidUserRoleDataError,
     TemplateImportError
 )
 
+try:
+    # Click 8.3+ passes its UNSET sentinel for options that were not provided
+    from click._utils import Sentinel as _ClickSentinel
+    _CLICK_SENTINEL_TYPES = (_ClickSentinel,)
+except ImportError:
+    _CLICK_SENTINEL_TYPES = ()
+
+# Row block for the user role list, filled in once per assignment
+_USER_ROLE_ROW_TEMPLATE = "User ID: {user_id}\nRoles ({role_count}):{role_lines}\nCreated On: {created_on}\n" + SEPARATOR
+
 
 def parse_json_input(json_input: str) -> Dict[str, Any]:
     """Parse JSON input from string or file."""
     # Handle None, empty string, or Click Sentinel objects
-    if not json_input or (hasattr(json_input, '__class__') and 'Sentinel' in json_input.__class__.__name__):
+    if not json_input or isinstance(json_input, _CLICK_SENTINEL_TYPES):
         return {}
     
-    try:
-        # Try to parse as JSON string first
-        return json.loads(json_input)
-    except json.JSONDecodeError:
-        # If that fails, try to read as file path
+    # Decide file vs. inline JSON up front so the payload is parsed exactly once
+    if os.path.isfile(json_input):
         try:
-            with open(json_input, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, IOError):
+            # Read raw bytes so the parser can skip a separate text decode step
+            with open(json_input, 'rb') as f:
+                return loads_json(f.read())
+        except IOError:
             raise click.BadParameter(
                 f"Invalid JSON input: '{json_input}' is neither valid JSON nor a readable file path"
             )
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # The stdlib parser raises UnicodeDecodeError for bytes that are not UTF-8
             raise click.BadParameter(
                 f"Invalid JSON in file '{json_input}': file contains invalid JSON format"
             )
+    
+    try:
+        return loads_json(json_input)
+    except json.JSONDecodeError:
+        raise click.BadParameter(
+            f"Invalid JSON input: '{json_input}' is neither valid JSON nor a readable file path"
+        )
+
+
+def _should_report_progress(page_count: int) -> bool:
+    """Return True for pages whose auto-pagination progress should be shown.
+    
+    Progress is reported for page 1, every power of two and every 10th page so that
+    large paginations do not write a status line for every page.
+    """
+    return page_count & (page_count - 1) == 0 or page_count % 10 == 0
+
+
+# Optional detail fields shown after the ID and message of a create/update/delete result
+_TIMESTAMP_FIELD = ('Timestamp', 'timestamp', None)
+_OPERATION_FIELD = ('Operation', 'operation', None)
 
 
 def format_role_output(role_data: Dict[str, Any], json_output: bool = False) -> str:
     """Format role data for CLI output."""
     if json_output:
-        return json.dumps(role_data, indent=2)
+        return dumps_json(role_data)
     
     # CLI-friendly formatting
     output_lines = []
@@ -107,9 +144,7 @@ def list(ctx: click.Context, page_size: Optional[int], max_items: Optional[int],
         vamscli role list --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     # Validate pagination options
     if auto_paginate and starting_token:
@@ -152,13 +187,15 @@ def list(ctx: click.Context, page_size: Optional[int], max_items: Optional[int],
             all_items.extend(items)
             total_fetched += len(items)
             
-            # Show progress in CLI mode
-            if not json_output:
-                output_status(f"Fetched {total_fetched} roles (page {page_count})...", False)
-            
             # Check if we should continue
             next_token = message_data.get('NextToken')
-            if not next_token or total_fetched >= max_total_items:
+            has_more = bool(next_token) and total_fetched < max_total_items
+            
+            # Show progress in CLI mode (throttled, final page always reported)
+            if not json_output and (not has_more or _should_report_progress(page_count)):
+                output_status(f"Fetched {total_fetched} roles (page {page_count})...", False)
+            
+            if not has_more:
                 break
         
         # Create final result
@@ -209,25 +246,32 @@ def list(ctx: click.Context, page_size: Optional[int], max_items: Optional[int],
             lines.append("")
         
         lines.append(f"Found {len(roles)} role(s):")
-        lines.append("-" * 80)
+        lines.append(SEPARATOR)
+        
+        # Bind hot-loop lookups locally; this runs once per role on large auto-paginated lists
+        append = lines.append
         
         for role in roles:
-            lines.append(f"Role Name: {role.get('roleName', 'N/A')}")
-            lines.append(f"Description: {role.get('description', 'N/A')}")
+            g = role.get
+            append(f"Role Name: {g('roleName', 'N/A')}")
+            append(f"Description: {g('description', 'N/A')}")
             
-            if role.get('id'):
-                lines.append(f"ID: {role.get('id')}")
-            if role.get('createdOn'):
-                lines.append(f"Created On: {role.get('createdOn')}")
-            if role.get('source'):
-                lines.append(f"Source: {role.get('source')}")
-            if role.get('sourceIdentifier'):
-                lines.append(f"Source Identifier: {role.get('sourceIdentifier')}")
+            role_id = g('id')
+            if role_id:
+                append(f"ID: {role_id}")
+            created_on = g('createdOn')
+            if created_on:
+                append(f"Created On: {created_on}")
+            source = g('source')
+            if source:
+                append(f"Source: {source}")
+            source_identifier = g('sourceIdentifier')
+            if source_identifier:
+                append(f"Source Identifier: {source_identifier}")
             
-            mfa_required = role.get('mfaRequired', False)
-            lines.append(f"MFA Required: {mfa_required}")
+            append(f"MFA Required: {g('mfaRequired', False)}")
             
-            lines.append("-" * 80)
+            append(SEPARATOR)
         
         # Show nextToken for manual pagination
         if not data.get('autoPaginated') and data.get('NextToken'):
@@ -266,9 +310,7 @@ def create(ctx: click.Context, role_name: str, description: Optional[str], sourc
         vamscli role create --json-input role.json
     """
     # Get profile manager and API client (setup/auth already validated by decorator)
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build role data
@@ -361,9 +403,7 @@ def update(ctx: click.Context, role_name: str, description: Optional[str], sourc
         vamscli role update --json-input '{"roleName":"admin","description":"Updated"}'
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build update data
@@ -446,7 +486,7 @@ def update(ctx: click.Context, role_name: str, description: Optional[str], sourc
 
 @role.command()
 @click.option('-r', '--role-name', required=True, help='Role name to delete')
-@click.option('--confirm', is_flag=True, help='Confirm role deletion')
+@click.option('--confirm', '--yes', is_flag=True, help='Confirm role deletion without prompting')
 @click.option('--json-output', is_flag=True, help='Output raw JSON response')
 @click.pass_context
 @requires_setup_and_auth
@@ -460,48 +500,47 @@ def delete(ctx: click.Context, role_name: str, confirm: bool, json_output: bool)
     any users before it can be deleted. The backend will automatically clean up
     any user role assignments when the role is deleted.
     
-    The --confirm flag is required to prevent accidental deletions.
+    Without --confirm you are prompted once before the role is deleted. When
+    stdin is not a terminal, or with --json-output, the --confirm flag is required.
     
     Examples:
+        vamscli role delete -r old-role
         vamscli role delete -r old-role --confirm
         vamscli role delete -r old-role --confirm --json-output
     """
+    # Confirmation is handled here rather than in an option callback so that it only
+    # happens after the setup/auth checks of the decorator
+    if not confirm:
+        if json_output:
+            error_result = {
+                "error": "Confirmation required",
+                "message": "Role deletion requires the --confirm flag",
+                "roleName": role_name
+            }
+            output_result(error_result, json_output=True)
+            sys.exit(1)
+        
+        if not stdin_is_interactive():
+            # No terminal to answer a prompt: refuse like an explicit "no"
+            click.secho("⚠️  Role deletion requires explicit confirmation!", fg='yellow', bold=True)
+            click.echo("This action will delete the role and cannot be undone.")
+            click.echo("The backend will automatically clean up any user role assignments.")
+            click.echo()
+            click.echo("Use --confirm flag to proceed with deletion.")
+            raise click.ClickException("Confirmation required for role deletion")
+        
+        click.secho(f"⚠️  You are about to delete role '{role_name}'", fg='red', bold=True)
+        click.echo("This action cannot be undone!")
+        click.echo("The backend will automatically clean up any user role assignments.")
+        
+        if not click.confirm("Are you sure you want to proceed?"):
+            click.echo("Deletion cancelled.")
+            return None
+    
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
-        # Require confirmation for deletion
-        if not confirm:
-            if json_output:
-                # For JSON output, return error in JSON format
-                import sys
-                error_result = {
-                    "error": "Confirmation required",
-                    "message": "Role deletion requires the --confirm flag",
-                    "roleName": role_name
-                }
-                output_result(error_result, json_output=True)
-                sys.exit(1)
-            else:
-                # For CLI output, show helpful message
-                click.secho("⚠️  Role deletion requires explicit confirmation!", fg='yellow', bold=True)
-                click.echo("This action will delete the role and cannot be undone.")
-                click.echo("The backend will automatically clean up any user role assignments.")
-                click.echo()
-                click.echo("Use --confirm flag to proceed with deletion.")
-                raise click.ClickException("Confirmation required for role deletion")
-        
-        # Additional confirmation prompt for safety (skip in JSON mode)
-        if not json_output:
-            click.secho(f"⚠️  You are about to delete role '{role_name}'", fg='red', bold=True)
-            click.echo("This action cannot be undone!")
-            
-            if not click.confirm("Are you sure you want to proceed?"):
-                click.echo("Deletion cancelled.")
-                return None
-        
         output_status(f"Deleting role '{role_name}'...", json_output)
         
         # Delete the role
@@ -548,69 +587,118 @@ def delete(ctx: click.Context, role_name: str, confirm: bool, json_output: bool)
 def format_constraint_output(constraint_data: Dict[str, Any], json_output: bool = False) -> str:
     """Format constraint data for CLI output."""
     if json_output:
-        return json.dumps(constraint_data, indent=2)
-    
-    # CLI-friendly formatting
-    output_lines = []
-    output_lines.append("Constraint Details:")
-    output_lines.append(f"  Constraint ID: {constraint_data.get('constraintId', 'N/A')}")
-    output_lines.append(f"  Name: {constraint_data.get('name', 'N/A')}")
-    output_lines.append(f"  Description: {constraint_data.get('description', 'N/A')}")
-    output_lines.append(f"  Object Type: {constraint_data.get('objectType', 'N/A')}")
+        return dumps_json(constraint_data)
+    
+    # CLI-friendly formatting: fixed header built as a single string
+    output_lines = [
+        f"Constraint Details:\n"
+        f"  Constraint ID: {constraint_data.get('constraintId', 'N/A')}\n"
+        f"  Name: {constraint_data.get('name', 'N/A')}\n"
+        f"  Description: {constraint_data.get('description', 'N/A')}\n"
+        f"  Object Type: {constraint_data.get('objectType', 'N/A')}"
+    ]
+    append = output_lines.append
     
     # Criteria AND
     criteria_and = constraint_data.get('criteriaAnd', [])
     if criteria_and:
-        output_lines.append(f"  Criteria AND ({len(criteria_and)} conditions):")
+        append(f"  Criteria AND ({len(criteria_and)} conditions):")
         for i, criteria in enumerate(criteria_and, 1):
-            field = criteria.get('field', 'N/A')
-            operator = criteria.get('operator', 'N/A')
-            value = criteria.get('value', 'N/A')
-            output_lines.append(f"    [{i}] {field} {operator} {value}")
+            g = criteria.get
+            append(f"    [{i}] {g('field', 'N/A')} {g('operator', 'N/A')} {g('value', 'N/A')}")
     
     # Criteria OR
     criteria_or = constraint_data.get('criteriaOr', [])
     if criteria_or:
-        output_lines.append(f"  Criteria OR ({len(criteria_or)} conditions):")
+        append(f"  Criteria OR ({len(criteria_or)} conditions):")
         for i, criteria in enumerate(criteria_or, 1):
-            field = criteria.get('field', 'N/A')
-            operator = criteria.get('operator', 'N/A')
-            value = criteria.get('value', 'N/A')
-            output_lines.append(f"    [{i}] {field} {operator} {value}")
+            g = criteria.get
+            append(f"    [{i}] {g('field', 'N/A')} {g('operator', 'N/A')} {g('value', 'N/A')}")
     
     # Group Permissions
     group_perms = constraint_data.get('groupPermissions', [])
     if group_perms:
-        output_lines.append(f"  Group Permissions ({len(group_perms)}):")
+        append(f"  Group Permissions ({len(group_perms)}):")
         for i, perm in enumerate(group_perms, 1):
-            group_id = perm.get('groupId', 'N/A')
-            permission = perm.get('permission', 'N/A')
-            perm_type = perm.get('permissionType', 'N/A')
-            output_lines.append(f"    [{i}] {group_id}: {permission} ({perm_type})")
+            g = perm.get
+            append(f"    [{i}] {g('groupId', 'N/A')}: {g('permission', 'N/A')} ({g('permissionType', 'N/A')})")
     
     # User Permissions
     user_perms = constraint_data.get('userPermissions', [])
     if user_perms:
-        output_lines.append(f"  User Permissions ({len(user_perms)}):")
+        append(f"  User Permissions ({len(user_perms)}):")
         for i, perm in enumerate(user_perms, 1):
-            user_id = perm.get('userId', 'N/A')
-            permission = perm.get('permission', 'N/A')
-            perm_type = perm.get('permissionType', 'N/A')
-            output_lines.append(f"    [{i}] {user_id}: {permission} ({perm_type})")
+            g = perm.get
+            append(f"    [{i}] {g('userId', 'N/A')}: {g('permission', 'N/A')} ({g('permissionType', 'N/A')})")
     
     # Metadata
-    if constraint_data.get('dateCreated'):
-        output_lines.append(f"  Date Created: {constraint_data.get('dateCreated')}")
-    if constraint_data.get('dateModified'):
-        output_lines.append(f"  Date Modified: {constraint_data.get('dateModified')}")
-    if constraint_data.get('createdBy'):
-        output_lines.append(f"  Created By: {constraint_data.get('createdBy')}")
-    if constraint_data.get('modifiedBy'):
-        output_lines.append(f"  Modified By: {constraint_data.get('modifiedBy')}")
+    date_created = constraint_data.get('dateCreated')
+    if date_created:
+        append(f"  Date Created: {date_created}")
+    date_modified = constraint_data.get('dateModified')
+    if date_modified:
+        append(f"  Date Modified: {date_modified}")
+    created_by = constraint_data.get('createdBy')
+    if created_by:
+        append(f"  Created By: {created_by}")
+    modified_by = constraint_data.get('modifiedBy')
+    if modified_by:
+        append(f"  Modified By: {modified_by}")
     
     return '\n'.join(output_lines)
 
 
+def _iter_constraint_rows(constraints):
+    """Yield the CLI display lines for each constraint in a list, one row block at a time."""
+    for constraint in constraints:
+        yield f"Constraint ID: {constraint.get('constraintId', 'N/A')}"
+        yield f"Name: {constraint.get('name', 'N/A')}"
+        yield f"Description: {constraint.get('description', 'N/A')}"
+        yield f"Object Type: {constraint.get('objectType', 'N/A')}"
+        
+        # Show counts for complex fields
+        criteria_and = constraint.get('criteriaAnd', [])
+        criteria_or = constraint.get('criteriaOr', [])
+        group_perms = constraint.get('groupPermissions', [])
+        user_perms = constraint.get('userPermissions', [])
+        
+        if criteria_and:
+            yield f"Criteria AND: {len(criteria_and)} condition(s)"
+        if criteria_or:
+            yield f"Criteria OR: {len(criteria_or)} condition(s)"
+        if group_perms:
+            yield f"Group Permissions: {len(group_perms)}"
+        if user_perms:
+            yield f"User Permissions: {len(user_perms)}"
+        
+        yield SEPARATOR
+
+
+def _iter_constraint_lines(data: Dict[str, Any]):
+    """Yield the CLI display lines for a constraints list response."""
+    constraints = data.get('Items', [])
+    
+    yield f"Found {len(constraints)} constraint(s):"
+    yield SEPARATOR
+    
+    yield from _iter_constraint_rows(constraints)
+    
+    # Show nextToken for manual pagination
+    next_token = data.get('NextToken')
+    if next_token:
+        yield f"\nNext token: {next_token}"
+        yield "Use --starting-token to get the next page"
+
+
+def format_constraints_list(data: Dict[str, Any]) -> str:
+    """Format constraints list for CLI display."""
+    if not data.get('Items'):
+        return "No constraints found."
+    
+    # Lines are produced lazily and joined once, without an intermediate list in this module
+    return '\n'.join(_iter_constraint_lines(data))
+
+
 @click.group()
 def constraint():
     """Constraint management commands."""
@@ -657,9 +745,7 @@ def list_constraints(ctx: click.Context, page_size: Optional[int], max_items: Op
         vamscli role constraint list --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     # Validate pagination options
     if auto_paginate and starting_token:
@@ -678,49 +764,45 @@ def list_constraints(ctx: click.Context, page_size: Optional[int], max_items: Op
         max_total_items = max_items or 10000
         output_status(f"Retrieving constraints (auto-paginating up to {max_total_items} items)...", json_output)
         
-        all_items = []
-        next_token = None
-        total_fetched = 0
-        page_count = 0
+        all_items = []  # Only populated for JSON output
+        extend_items = all_items.extend
         
-        while True:
-            page_count += 1
-            
-            # Prepare query parameters for this page
-            params = {}
-            if page_size:
-                params['pageSize'] = page_size
-            if next_token:
-                params['startingToken'] = next_token
+        # The API client already unwraps the message field of each page
+        for page, page_count, total_fetched, has_more in iter_pages(
+                api_client.list_constraints, page_size, max_total_items):
+            items = page.get('Items', [])
             
-            # Make API call (API client already unwraps message field)
-            page_result = api_client.list_constraints(params)
-            
-            # Get items
-            items = page_result.get('Items', [])
-            all_items.extend(items)
-            total_fetched += len(items)
+            # JSON output needs the full list; CLI output streams each page's rows
+            # as it arrives so memory stays bounded by the page size
+            if json_output:
+                extend_items(items)
+            elif items:
+                click.echo('\n'.join(_iter_constraint_rows(items)))
             
-            # Show progress in CLI mode
-            if not json_output:
+            # Show progress in CLI mode (throttled, final page always reported)
+            if not json_output and (not has_more or _should_report_progress(page_count)):
                 output_status(f"Fetched {total_fetched} constraints (page {page_count})...", False)
-            
-            # Check if we should continue
-            next_token = page_result.get('NextToken')
-            if not next_token or total_fetched >= max_total_items:
-                break
         
         # Create final result
         result = {
             'Items': all_items,
-            'totalItems': len(all_items),
+            'totalItems': total_fetched,
             'autoPaginated': True,
             'pageCount': page_count
         }
         
-        if total_fetched >= max_total_items and next_token:
+        if page.get('NextToken'):
             result['note'] = f"Reached maximum of {max_total_items} items. More items may be available."
         
+        if not json_output:
+            # Rows were already printed page by page; finish with the summary only
+            if total_fetched:
+                click.echo('\n'.join(iter_auto_paginate_summary(result)))
+                click.echo(f"Found {total_fetched} constraint(s).")
+            else:
+                click.echo("No constraints found.")
+            return result
+        
     else:
         # Manual pagination mode: single API call
         output_status("Retrieving constraints...", json_output)
@@ -735,54 +817,6 @@ def list_constraints(ctx: click.Context, page_size: Optional[int], max_items: Op
         # List constraints (API client already unwraps message field)
         result = api_client.list_constraints(params)
     
-    def format_constraints_list(data):
-        """Format constraints list for CLI display."""
-        constraints = data.get('Items', [])
-        if not constraints:
-            return "No constraints found."
-        
-        lines = []
-        
-        # Show auto-pagination info if present
-        if data.get('autoPaginated'):
-            lines.append(f"\nAuto-paginated: Retrieved {data.get('totalItems', 0)} items in {data.get('pageCount', 0)} page(s)")
-            if data.get('note'):
-                lines.append(f"⚠️  {data['note']}")
-            lines.append("")
-        
-        lines.append(f"Found {len(constraints)} constraint(s):")
-        lines.append("-" * 80)
-        
-        for constraint in constraints:
-            lines.append(f"Constraint ID: {constraint.get('constraintId', 'N/A')}")
-            lines.append(f"Name: {constraint.get('name', 'N/A')}")
-            lines.append(f"Description: {constraint.get('description', 'N/A')}")
-            lines.append(f"Object Type: {constraint.get('objectType', 'N/A')}")
-            
-            # Show counts for complex fields
-            criteria_and = constraint.get('criteriaAnd', [])
-            criteria_or = constraint.get('criteriaOr', [])
-            group_perms = constraint.get('groupPermissions', [])
-            user_perms = constraint.get('userPermissions', [])
-            
-            if criteria_and:
-                lines.append(f"Criteria AND: {len(criteria_and)} condition(s)")
-            if criteria_or:
-                lines.append(f"Criteria OR: {len(criteria_or)} condition(s)")
-            if group_perms:
-                lines.append(f"Group Permissions: {len(group_perms)}")
-            if user_perms:
-                lines.append(f"User Permissions: {len(user_perms)}")
-            
-            lines.append("-" * 80)
-        
-        # Show nextToken for manual pagination
-        if not data.get('autoPaginated') and data.get('NextToken'):
-            lines.append(f"\nNext token: {data['NextToken']}")
-            lines.append("Use --starting-token to get the next page")
-        
-        return '\n'.join(lines)
-    
     output_result(result, json_output, cli_formatter=format_constraints_list)
     return result
 
@@ -804,9 +838,7 @@ def get_constraint(ctx: click.Context, constraint_id: str, json_output: bool):
         vamscli role constraint get -c my-constraint --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         output_status(f"Retrieving constraint '{constraint_id}'...", json_output)
@@ -870,10 +902,8 @@ def create_constraint(ctx: click.Context, constraint_id: str, name: Optional[str
         vamscli role constraint create -c my-constraint --json-input constraint.json
         vamscli role constraint create -c my-constraint --json-input '{"name":"Test","description":"Test constraint","objectType":"asset","criteriaAnd":[{"field":"databaseId","operator":"equals","value":"db1"}],"groupPermissions":[{"groupId":"admin","permission":"read","permissionType":"allow"}]}'
     """
-    # Get profile manager and API client (setup/auth already validated by decorator)
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    # Setup/auth already validated by decorator
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build constraint data
@@ -906,22 +936,16 @@ def create_constraint(ctx: click.Context, constraint_id: str, name: Optional[str
         # Create the constraint
         result = api_client.create_constraint(constraint_data)
         
-        def format_create_result(data):
-            """Format create result for CLI display."""
-            lines = []
-            lines.append(f"  Constraint ID: {data.get('constraintId', constraint_id)}")
-            lines.append(f"  Message: {data.get('message', 'Constraint created')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            if data.get('operation'):
-                lines.append(f"  Operation: {data.get('operation')}")
-            return '\n'.join(lines)
-        
         output_result(
             result,
             json_output,
             success_message="✓ Constraint created successfully!",
-            cli_formatter=format_create_result
+            cli_formatter=partial(format_result_fields, (
+                ('Constraint ID', 'constraintId', constraint_id),
+                ('Message', 'message', 'Constraint created'),
+                _TIMESTAMP_FIELD,
+                _OPERATION_FIELD
+            ))
         )
         
         return result
@@ -966,9 +990,7 @@ def update_constraint(ctx: click.Context, constraint_id: str, name: Optional[str
         vamscli role constraint update -c my-constraint --name "Updated Name" --description "Updated Description"
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build update data
@@ -978,13 +1000,22 @@ def update_constraint(ctx: click.Context, constraint_id: str, name: Optional[str
             # Override constraint_id from command line
             constraint_data['identifier'] = constraint_id
         else:
-            # For updates without JSON input, we need to get the existing constraint first
-            # and then apply the updates
+            # Ensure at least one field is being updated before making any API calls
+            updates_made = name or description or object_type
+            if not updates_made:
+                raise click.BadParameter(
+                    "At least one field must be provided for update. "
+                    "Use --name, --description, --object-type, or --json-input."
+                )
+            
+            # The update replaces the entire constraint, so the existing record is always
+            # fetched first - even when every basic field is given, skipping this would
+            # wipe the criteria and permissions
             output_status(f"Retrieving existing constraint '{constraint_id}'...", json_output)
             existing_constraint = api_client.get_constraint(constraint_id)
             
-            # Start with existing data
-            constraint_data = existing_constraint.copy()
+            # Start with existing data; the fetched record is not used elsewhere, so update it in place
+            constraint_data = existing_constraint
             constraint_data['identifier'] = constraint_id
             
             # Apply updates
@@ -994,36 +1025,22 @@ def update_constraint(ctx: click.Context, constraint_id: str, name: Optional[str
                 constraint_data['description'] = description
             if object_type:
                 constraint_data['objectType'] = object_type
-            
-            # Ensure at least one field is being updated
-            updates_made = name or description or object_type
-            if not updates_made:
-                raise click.BadParameter(
-                    "At least one field must be provided for update. "
-                    "Use --name, --description, --object-type, or --json-input."
-                )
         
         output_status(f"Updating constraint '{constraint_id}'...", json_output)
         
         # Update the constraint
         result = api_client.update_constraint(constraint_id, constraint_data)
         
-        def format_update_result(data):
-            """Format update result for CLI display."""
-            lines = []
-            lines.append(f"  Constraint ID: {data.get('constraintId', constraint_id)}")
-            lines.append(f"  Message: {data.get('message', 'Constraint updated')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            if data.get('operation'):
-                lines.append(f"  Operation: {data.get('operation')}")
-            return '\n'.join(lines)
-        
         output_result(
             result,
             json_output,
             success_message="✓ Constraint updated successfully!",
-            cli_formatter=format_update_result
+            cli_formatter=partial(format_result_fields, (
+                ('Constraint ID', 'constraintId', constraint_id),
+                ('Message', 'message', 'Constraint updated'),
+                _TIMESTAMP_FIELD,
+                _OPERATION_FIELD
+            ))
         )
         
         return result
@@ -1065,61 +1082,53 @@ def delete_constraint(ctx: click.Context, constraint_id: str, confirm: bool, jso
         vamscli role constraint delete -c old-constraint --confirm
         vamscli role constraint delete -c old-constraint --confirm --json-output
     """
+    # Require confirmation before any profile/config I/O or API client setup
+    if not confirm:
+        if json_output:
+            # For JSON output, return error in JSON format
+            error_result = {
+                "error": "Confirmation required",
+                "message": "Constraint deletion requires the --confirm flag",
+                "constraintId": constraint_id
+            }
+            output_result(error_result, json_output=True)
+            sys.exit(1)
+        else:
+            # For CLI output, show helpful message
+            click.secho("⚠️  Constraint deletion requires explicit confirmation!", fg='yellow', bold=True)
+            click.echo("This action will delete the constraint and cannot be undone.")
+            click.echo("All associated permissions will be permanently removed.")
+            click.echo()
+            click.echo("Use --confirm flag to proceed with deletion.")
+            raise click.ClickException("Confirmation required for constraint deletion")
+    
+    # Additional confirmation prompt for safety (skip in JSON mode)
+    if not json_output:
+        click.secho(f"⚠️  You are about to delete constraint '{constraint_id}'", fg='red', bold=True)
+        click.echo("This action cannot be undone!")
+        
+        if not click.confirm("Are you sure you want to proceed?"):
+            click.echo("Deletion cancelled.")
+            return None
+    
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
-        # Require confirmation for deletion
-        if not confirm:
-            if json_output:
-                # For JSON output, return error in JSON format
-                import sys
-                error_result = {
-                    "error": "Confirmation required",
-                    "message": "Constraint deletion requires the --confirm flag",
-                    "constraintId": constraint_id
-                }
-                output_result(error_result, json_output=True)
-                sys.exit(1)
-            else:
-                # For CLI output, show helpful message
-                click.secho("⚠️  Constraint deletion requires explicit confirmation!", fg='yellow', bold=True)
-                click.echo("This action will delete the constraint and cannot be undone.")
-                click.echo("All associated permissions will be permanently removed.")
-                click.echo()
-                click.echo("Use --confirm flag to proceed with deletion.")
-                raise click.ClickException("Confirmation required for constraint deletion")
-        
-        # Additional confirmation prompt for safety (skip in JSON mode)
-        if not json_output:
-            click.secho(f"⚠️  You are about to delete constraint '{constraint_id}'", fg='red', bold=True)
-            click.echo("This action cannot be undone!")
-            
-            if not click.confirm("Are you sure you want to proceed?"):
-                click.echo("Deletion cancelled.")
-                return None
-        
         output_status(f"Deleting constraint '{constraint_id}'...", json_output)
         
         # Delete the constraint
         result = api_client.delete_constraint(constraint_id)
         
-        def format_delete_result(data):
-            """Format delete result for CLI display."""
-            lines = []
-            lines.append(f"  Constraint ID: {constraint_id}")
-            lines.append(f"  Message: {data.get('message', 'Constraint deleted')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            return '\n'.join(lines)
-        
         output_result(
             result,
             json_output,
             success_message="✓ Constraint deleted successfully!",
-            cli_formatter=format_delete_result
+            cli_formatter=partial(format_result_fields, (
+                ('Constraint ID', None, constraint_id),
+                ('Message', 'message', 'Constraint deleted'),
+                _TIMESTAMP_FIELD
+            ))
         )
         
         return result
@@ -1149,26 +1158,63 @@ def delete_constraint(ctx: click.Context, constraint_id: str, confirm: bool, jso
 def format_user_role_output(user_role_data: Dict[str, Any], json_output: bool = False) -> str:
     """Format user role data for CLI output."""
     if json_output:
-        return json.dumps(user_role_data, indent=2)
+        return dumps_json(user_role_data)
     
     # CLI-friendly formatting
-    output_lines = []
-    output_lines.append("User Role Details:")
-    output_lines.append(f"  User ID: {user_role_data.get('userId', 'N/A')}")
-    
-    # Role names
     role_names = user_role_data.get('roleName', [])
     if role_names:
-        output_lines.append(f"  Roles ({len(role_names)}):")
-        for i, role_name in enumerate(role_names, 1):
-            output_lines.append(f"    [{i}] {role_name}")
+        # A list (not a generator) lets join size its buffer in one pass
+        roles_block = f"  Roles ({len(role_names)}):\n" + '\n'.join(
+            [f"    [{i}] {role_name}" for i, role_name in enumerate(role_names, 1)]
+        )
     else:
-        output_lines.append("  Roles: (none)")
+        roles_block = "  Roles: (none)"
     
-    if user_role_data.get('createdOn'):
-        output_lines.append(f"  Created On: {user_role_data.get('createdOn')}")
+    output = f"User Role Details:\n  User ID: {user_role_data.get('userId', 'N/A')}\n{roles_block}"
     
-    return '\n'.join(output_lines)
+    created_on = user_role_data.get('createdOn')
+    if created_on:
+        output += f"\n  Created On: {created_on}"
+    
+    return output
+
+
+def _format_user_role_row(user_role: Dict[str, Any]) -> str:
+    """Format one user role assignment as a single multi-line block for list display."""
+    # Each field is looked up exactly once; a null roleName renders as an empty role list
+    g = user_role.get
+    user_id = g('userId', 'N/A')
+    role_names = g('roleName') or ()
+    created_on = g('createdOn', 'N/A')
+    
+    role_lines = ''.join([f"\n  [{i}] {role_name}" for i, role_name in enumerate(role_names, 1)])
+    return _USER_ROLE_ROW_TEMPLATE.format_map({
+        'user_id': user_id,
+        'role_count': len(role_names),
+        'role_lines': role_lines,
+        'created_on': created_on
+    })
+
+
+def format_user_roles_list(data: Dict[str, Any]) -> str:
+    """Format user roles list for CLI display."""
+    # Empty results return before any other lookups or allocations
+    user_roles = data.get('Items')
+    if not user_roles:
+        return "No user role assignments found."
+    
+    lines = [f"Found {len(user_roles)} user role assignment(s):", SEPARATOR]
+    
+    # One pre-joined block per user role keeps the line list small for large listings
+    lines.extend(map(_format_user_role_row, user_roles))
+    
+    # Show nextToken for manual pagination
+    next_token = data.get('NextToken')
+    if next_token:
+        lines.append(f"\nNext token: {next_token}")
+        lines.append("Use --starting-token to get the next page")
+    
+    return '\n'.join(lines)
 
 
 @click.group()
@@ -1218,9 +1264,7 @@ def list_user_roles(ctx: click.Context, page_size: Optional[int], max_items: Opt
         vamscli role user list --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     # Validate pagination options
     if auto_paginate and starting_token:
@@ -1239,49 +1283,45 @@ def list_user_roles(ctx: click.Context, page_size: Optional[int], max_items: Opt
         max_total_items = max_items or 10000
         output_status(f"Retrieving user roles (auto-paginating up to {max_total_items} items)...", json_output)
         
-        all_items = []
-        next_token = None
-        total_fetched = 0
-        page_count = 0
+        all_items = []  # Only populated for JSON output
         
-        while True:
-            page_count += 1
+        # The API client already unwraps the message field of each page
+        for page, page_count, total_fetched, has_more in iter_pages(
+                api_client.list_user_roles, page_size, max_total_items):
+            items = page.get('Items', [])
             
-            # Prepare query parameters for this page
-            params = {}
-            if page_size:
-                params['pageSize'] = page_size
-            if next_token:
-                params['startingToken'] = next_token
-            
-            # Make API call (API client already unwraps message field)
-            page_result = api_client.list_user_roles(params)
-            
-            # Get items
-            items = page_result.get('Items', [])
-            all_items.extend(items)
-            total_fetched += len(items)
+            # JSON output needs the full list; CLI output streams each page's rows
+            # as it arrives so memory stays bounded by the page size
+            if json_output:
+                all_items.extend(items)
+            elif items:
+                click.echo('\n'.join(map(_format_user_role_row, items)))
             
-            # Show progress in CLI mode
-            if not json_output:
+            # Show progress in CLI mode only (throttled, final page always reported); the
+            # message is not even formatted for JSON output
+            if not json_output and (not has_more or _should_report_progress(page_count)):
                 output_status(f"Fetched {total_fetched} user role assignments (page {page_count})...", False)
-            
-            # Check if we should continue
-            next_token = page_result.get('NextToken')
-            if not next_token or total_fetched >= max_total_items:
-                break
         
         # Create final result
         result = {
             'Items': all_items,
-            'totalItems': len(all_items),
+            'totalItems': total_fetched,
             'autoPaginated': True,
             'pageCount': page_count
         }
         
-        if total_fetched >= max_total_items and next_token:
+        if page.get('NextToken'):
             result['note'] = f"Reached maximum of {max_total_items} items. More items may be available."
         
+        if not json_output:
+            # Rows were already printed page by page; finish with the summary only
+            if total_fetched:
+                click.echo('\n'.join(iter_auto_paginate_summary(result)))
+                click.echo(f"Found {total_fetched} user role assignment(s).")
+            else:
+                click.echo("No user role assignments found.")
+            return result
+        
     else:
         # Manual pagination mode: single API call
         output_status("Retrieving user roles...", json_output)
@@ -1296,43 +1336,6 @@ def list_user_roles(ctx: click.Context, page_size: Optional[int], max_items: Opt
         # List user roles (API client already unwraps message field)
         result = api_client.list_user_roles(params)
     
-    def format_user_roles_list(data):
-        """Format user roles list for CLI display."""
-        user_roles = data.get('Items', [])
-        if not user_roles:
-            return "No user role assignments found."
-        
-        lines = []
-        
-        # Show auto-pagination info if present
-        if data.get('autoPaginated'):
-            lines.append(f"\nAuto-paginated: Retrieved {data.get('totalItems', 0)} items in {data.get('pageCount', 0)} page(s)")
-            if data.get('note'):
-                lines.append(f"⚠️  {data['note']}")
-            lines.append("")
-        
-        lines.append(f"Found {len(user_roles)} user role assignment(s):")
-        lines.append("-" * 80)
-        
-        for user_role in user_roles:
-            user_id = user_role.get('userId', 'N/A')
-            role_names = user_role.get('roleName', [])
-            created_on = user_role.get('createdOn', 'N/A')
-            
-            lines.append(f"User ID: {user_id}")
-            lines.append(f"Roles ({len(role_names)}):")
-            for i, role_name in enumerate(role_names, 1):
-                lines.append(f"  [{i}] {role_name}")
-            lines.append(f"Created On: {created_on}")
-            lines.append("-" * 80)
-        
-        # Show nextToken for manual pagination
-        if not data.get('autoPaginated') and data.get('NextToken'):
-            lines.append(f"\nNext token: {data['NextToken']}")
-            lines.append("Use --starting-token to get the next page")
-        
-        return '\n'.join(lines)
-    
     output_result(result, json_output, cli_formatter=format_user_roles_list)
     return result
 
@@ -1363,10 +1366,8 @@ def create_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
         vamscli role user create -u user@example.com --json-input '{"roleName":["admin","viewer"]}'
         vamscli role user create -u user@example.com --json-input user-roles.json
     """
-    # Get profile manager and API client (setup/auth already validated by decorator)
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    # Setup/auth already validated by decorator
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build user role data
@@ -1380,10 +1381,9 @@ def create_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
             if not role_name:
                 raise click.BadParameter("At least one --role-name is required when not using --json-input")
             
-            # Use explicit reference to built-in list function to avoid namespace collision
             user_role_data = {
                 'userId': user_id,
-                'roleName': __builtins__['list'](role_name)
+                'roleName': builtin_list(role_name)
             }
         
         output_status(f"Assigning roles to user '{user_id}'...", json_output)
@@ -1391,22 +1391,16 @@ def create_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
         # Create the user roles
         result = api_client.create_user_roles(user_role_data)
         
-        def format_create_result(data):
-            """Format create result for CLI display."""
-            lines = []
-            lines.append(f"  User ID: {data.get('userId', user_id)}")
-            lines.append(f"  Message: {data.get('message', 'User roles created')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            if data.get('operation'):
-                lines.append(f"  Operation: {data.get('operation')}")
-            return '\n'.join(lines)
-        
         output_result(
             result,
             json_output,
             success_message="✓ User roles assigned successfully!",
-            cli_formatter=format_create_result
+            cli_formatter=partial(format_result_fields, (
+                ('User ID', 'userId', user_id),
+                ('Message', 'message', 'User roles created'),
+                _TIMESTAMP_FIELD,
+                _OPERATION_FIELD
+            ))
         )
         
         return result
@@ -1414,23 +1408,17 @@ def create_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
     except click.BadParameter as e:
         output_error(e, json_output, error_type="Invalid Input")
         raise click.ClickException(str(e))
-    except Exception as e:
-        # Import user role exceptions
-        from ..utils.exceptions import UserRoleAlreadyExistsError, InvalidUserRoleDataError
-        
-        if isinstance(e, UserRoleAlreadyExistsError):
-            output_error(
-                e,
-                json_output,
-                error_type="User Role Already Exists",
-                helpful_message="One or more roles are already assigned to this user. Use 'vamscli role user list' to see existing assignments."
-            )
-            raise click.ClickException(str(e))
-        elif isinstance(e, InvalidUserRoleDataError):
-            output_error(e, json_output, error_type="Invalid User Role Data")
-            raise click.ClickException(str(e))
-        else:
-            raise
+    except UserRoleAlreadyExistsError as e:
+        output_error(
+            e,
+            json_output,
+            error_type="User Role Already Exists",
+            helpful_message="One or more roles are already assigned to this user. Use 'vamscli role user list' to see existing assignments."
+        )
+        raise click.ClickException(str(e))
+    except InvalidUserRoleDataError as e:
+        output_error(e, json_output, error_type="Invalid User Role Data")
+        raise click.ClickException(str(e))
 
 
 @user.command('update')
@@ -1454,9 +1442,7 @@ def update_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
         vamscli role user update -u user@example.com --json-input user-roles.json
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build user role data
@@ -1470,10 +1456,9 @@ def update_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
             if not role_name:
                 raise click.BadParameter("At least one --role-name is required when not using --json-input")
             
-            # Use explicit reference to built-in list function to avoid namespace collision
             user_role_data = {
                 'userId': user_id,
-                'roleName': __builtins__['list'](role_name)
+                'roleName': builtin_list(role_name)
             }
         
         output_status(f"Updating roles for user '{user_id}'...", json_output)
@@ -1481,22 +1466,16 @@ def update_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
         # Update the user roles
         result = api_client.update_user_roles(user_role_data)
         
-        def format_update_result(data):
-            """Format update result for CLI display."""
-            lines = []
-            lines.append(f"  User ID: {data.get('userId', user_id)}")
-            lines.append(f"  Message: {data.get('message', 'User roles updated')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            if data.get('operation'):
-                lines.append(f"  Operation: {data.get('operation')}")
-            return '\n'.join(lines)
-        
         output_result(
             result,
             json_output,
             success_message="✓ User roles updated successfully!",
-            cli_formatter=format_update_result
+            cli_formatter=partial(format_result_fields, (
+                ('User ID', 'userId', user_id),
+                ('Message', 'message', 'User roles updated'),
+                _TIMESTAMP_FIELD,
+                _OPERATION_FIELD
+            ))
         )
         
         return result
@@ -1504,23 +1483,17 @@ def update_user_roles(ctx: click.Context, user_id: str, role_name: tuple, json_i
     except click.BadParameter as e:
         output_error(e, json_output, error_type="Invalid Input")
         raise click.ClickException(str(e))
-    except Exception as e:
-        # Import user role exceptions
-        from ..utils.exceptions import UserRoleNotFoundError, InvalidUserRoleDataError
-        
-        if isinstance(e, UserRoleNotFoundError):
-            output_error(
-                e,
-                json_output,
-                error_type="User Role Not Found",
-                helpful_message="Use 'vamscli role user list' to see existing user role assignments."
-            )
-            raise click.ClickException(str(e))
-        elif isinstance(e, InvalidUserRoleDataError):
-            output_error(e, json_output, error_type="Invalid User Role Data")
-            raise click.ClickException(str(e))
-        else:
-            raise
+    except UserRoleNotFoundError as e:
+        output_error(
+            e,
+            json_output,
+            error_type="User Role Not Found",
+            helpful_message="Use 'vamscli role user list' to see existing user role assignments."
+        )
+        raise click.ClickException(str(e))
+    except InvalidUserRoleDataError as e:
+        output_error(e, json_output, error_type="Invalid User Role Data")
+        raise click.ClickException(str(e))
 
 
 @user.command('delete')
@@ -1545,16 +1518,13 @@ def delete_user_roles(ctx: click.Context, user_id: str, confirm: bool, json_outp
         vamscli role user delete -u user@example.com --confirm --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Require confirmation for deletion
         if not confirm:
             if json_output:
                 # For JSON output, return error in JSON format
-                import sys
                 error_result = {
                     "error": "Confirmation required",
                     "message": "User role deletion requires the --confirm flag",
@@ -1571,8 +1541,9 @@ def delete_user_roles(ctx: click.Context, user_id: str, confirm: bool, json_outp
                 click.echo("Use --confirm flag to proceed with deletion.")
                 raise click.ClickException("Confirmation required for user role deletion")
         
-        # Additional confirmation prompt for safety (skip in JSON mode)
-        if not json_output:
+        # Additional confirmation prompt for safety (skip in JSON mode, and when stdin is not a
+        # terminal - scripts that pass --confirm should not block on a prompt they cannot answer)
+        if not json_output and stdin_is_interactive():
             click.secho(f"⚠️  You are about to delete ALL roles for user '{user_id}'", fg='red', bold=True)
             click.echo("This action cannot be undone!")
             
@@ -1585,48 +1556,36 @@ def delete_user_roles(ctx: click.Context, user_id: str, confirm: bool, json_outp
         # Delete the user roles
         result = api_client.delete_user_roles(user_id)
         
-        def format_delete_result(data):
-            """Format delete result for CLI display."""
-            lines = []
-            lines.append(f"  User ID: {user_id}")
-            lines.append(f"  Message: {data.get('message', 'User roles deleted')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            if data.get('operation'):
-                lines.append(f"  Operation: {data.get('operation')}")
-            return '\n'.join(lines)
-        
         output_result(
             result,
             json_output,
             success_message="✓ User roles deleted successfully!",
-            cli_formatter=format_delete_result
+            cli_formatter=partial(format_result_fields, (
+                ('User ID', None, user_id),
+                ('Message', 'message', 'User roles deleted'),
+                _TIMESTAMP_FIELD,
+                _OPERATION_FIELD
+            ))
         )
         
         return result
         
-    except Exception as e:
-        # Import user role exceptions
-        from ..utils.exceptions import UserRoleNotFoundError, UserRoleDeletionError
-        
-        if isinstance(e, UserRoleNotFoundError):
-            output_error(
-                e,
-                json_output,
-                error_type="User Role Not Found",
-                helpful_message="Use 'vamscli role user list' to see existing user role assignments."
-            )
-            raise click.ClickException(str(e))
-        elif isinstance(e, UserRoleDeletionError):
-            output_error(
-                e,
-                json_output,
-                error_type="User Role Deletion Error",
-                helpful_message="Check for dependencies or contact your administrator."
-            )
-            raise click.ClickException(str(e))
-        else:
-            raise
+    except UserRoleNotFoundError as e:
+        output_error(
+            e,
+            json_output,
+            error_type="User Role Not Found",
+            helpful_message="Use 'vamscli role user list' to see existing user role assignments."
+        )
+        raise click.ClickException(str(e))
+    except UserRoleDeletionError as e:
+        output_error(
+            e,
+            json_output,
+            error_type="User Role Deletion Error",
+            helpful_message="Check for dependencies or contact your administrator."
+        )
+        raise click.ClickException(str(e))
 
 
 #######################
@@ -1643,6 +1602,49 @@ def template():
 constraint.add_command(template)
 
 
+def _validate_template_data(template_data: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    Validate the required fields of a permission template in a single pass.
+    
+    Returns:
+        None if the template is valid, otherwise (error message, helpful message)
+        for the first problem found
+    """
+    variable_values = template_data.get('variableValues')
+    if variable_values is None:
+        return ("Missing 'variableValues' field",
+                "Template must include 'variableValues' with at least 'ROLE_NAME'.")
+    if not isinstance(variable_values, dict) or 'ROLE_NAME' not in variable_values:
+        return ("Missing 'ROLE_NAME' in variableValues",
+                "variableValues must include 'ROLE_NAME' (used as groupId for all constraints).")
+    if not template_data.get('constraints'):
+        return ("Missing or empty 'constraints' field",
+                "Template must include at least one constraint definition.")
+    return None
+
+
+def _format_import_result(template_name: str, role_name: str, data: Dict[str, Any]) -> str:
+    """Format a template import result for CLI display."""
+    lines = [
+        f"  Template: {template_name}",
+        f"  Role: {role_name}",
+        f"  Constraints Created: {data.get('constraintsCreated', 0)}"
+    ]
+
+    constraint_ids = data.get('constraintIds', [])
+    if constraint_ids:
+        lines.append("  Constraint IDs:")
+        lines.append('\n'.join([f"    - {cid}" for cid in constraint_ids]))
+
+    message = data.get('message')
+    if message:
+        lines.append(f"  Message: {message}")
+    timestamp = data.get('timestamp')
+    if timestamp:
+        lines.append(f"  Timestamp: {timestamp}")
+    return '\n'.join(lines)
+
+
 @template.command('import')
 @click.option('--json-input', '-j', required=True,
               help='Template JSON data as a string or path to a JSON file')
@@ -1671,9 +1673,7 @@ def template_import(ctx: click.Context, json_input: str, json_output: bool):
         vamscli role constraint template import -j ./database-admin.json --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
 
     try:
         # Parse JSON input (handles both JSON strings and file paths)
@@ -1689,32 +1689,16 @@ def template_import(ctx: click.Context, json_input: str, json_output: bool):
             raise click.ClickException("Template data is empty")
 
         # Validate required fields
-        if 'variableValues' not in template_data:
+        template_error = _validate_template_data(template_data)
+        if template_error:
+            error_message, helpful_message = template_error
             output_error(
-                ValueError("Missing 'variableValues' field"),
+                ValueError(error_message),
                 json_output,
                 error_type="Invalid Template Data",
-                helpful_message="Template must include 'variableValues' with at least 'ROLE_NAME'."
+                helpful_message=helpful_message
             )
-            raise click.ClickException("Missing 'variableValues' field in template data")
-
-        if 'ROLE_NAME' not in template_data.get('variableValues', {}):
-            output_error(
-                ValueError("Missing 'ROLE_NAME' in variableValues"),
-                json_output,
-                error_type="Invalid Template Data",
-                helpful_message="variableValues must include 'ROLE_NAME' (used as groupId for all constraints)."
-            )
-            raise click.ClickException("Missing 'ROLE_NAME' in variableValues")
-
-        if 'constraints' not in template_data or not template_data['constraints']:
-            output_error(
-                ValueError("Missing or empty 'constraints' field"),
-                json_output,
-                error_type="Invalid Template Data",
-                helpful_message="Template must include at least one constraint definition."
-            )
-            raise click.ClickException("Missing or empty 'constraints' field in template data")
+            raise click.ClickException(f"{error_message} in template data")
 
         role_name = template_data['variableValues']['ROLE_NAME']
         constraint_count = len(template_data['constraints'])
@@ -1728,55 +1712,29 @@ def template_import(ctx: click.Context, json_input: str, json_output: bool):
         # Call the API
         result = api_client.import_constraints_template(template_data)
 
-        def format_import_result(data):
-            """Format template import result for CLI display."""
-            lines = []
-            lines.append(f"  Template: {template_name}")
-            lines.append(f"  Role: {role_name}")
-            lines.append(f"  Constraints Created: {data.get('constraintsCreated', 0)}")
-
-            constraint_ids = data.get('constraintIds', [])
-            if constraint_ids:
-                lines.append(f"  Constraint IDs:")
-                for cid in constraint_ids:
-                    lines.append(f"    - {cid}")
-
-            if data.get('message'):
-                lines.append(f"  Message: {data.get('message')}")
-            if data.get('timestamp'):
-                lines.append(f"  Timestamp: {data.get('timestamp')}")
-            return '\n'.join(lines)
-
         output_result(
             result,
             json_output,
             success_message="Constraint template imported successfully!",
-            cli_formatter=format_import_result
+            cli_formatter=partial(_format_import_result, template_name, role_name)
         )
 
         return result
 
-    except click.ClickException:
-        raise
-    except click.BadParameter:
-        raise
-    except Exception as e:
-        if isinstance(e, InvalidConstraintDataError):
-            output_error(
-                e,
-                json_output,
-                error_type="Invalid Template Data",
-                helpful_message="Check your template JSON format and variable values. "
-                                "See 'documentation/permissionsTemplates/' for example templates."
-            )
-            raise click.ClickException(str(e))
-        elif isinstance(e, TemplateImportError):
-            output_error(
-                e,
-                json_output,
-                error_type="Template Import Error",
-                helpful_message="The template import failed on the server. Check the template data and try again."
-            )
-            raise click.ClickException(str(e))
-        else:
-            raise
+    except InvalidConstraintDataError as e:
+        output_error(
+            e,
+            json_output,
+            error_type="Invalid Template Data",
+            helpful_message="Check your template JSON format and variable values. "
+                            "See 'documentation/permissionsTemplates/' for example templates."
+        )
+        raise click.ClickException(str(e))
+    except TemplateImportError as e:
+        output_error(
+            e,
+            json_output,
+            error_type="Template Import Error",
+            helpful_message="The template import failed on the server. Check the template data and try again."
+        )
+        raise click.ClickException(str(e))
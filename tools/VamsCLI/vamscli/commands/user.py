@@ -1,12 +1,23 @@
 """User management commands for VamsCLI."""
 
+import json
+import sys
+from builtins import list as builtin_list
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 import click
 from typing import Dict, Any, Optional
 
-from ..utils.decorators import requires_setup_and_auth, get_profile_manager_from_context
+from ..constants import HTTP_POOL_MAXSIZE
+from ..utils.decorators import requires_setup_and_auth, get_api_client_from_context
 from ..utils.api_client import APIClient
-from ..utils.json_output import output_status, output_result, output_error
+from ..utils.cli_helpers import (
+    SEPARATOR, page_params, iter_pages, iter_auto_paginate_summary, stdin_is_interactive
+)
+from ..utils.json_output import output_status, output_result, output_error, loads_json
 from ..utils.exceptions import (
+    VamsCLIError,
     CognitoUserNotFoundError,
     CognitoUserAlreadyExistsError,
     InvalidCognitoUserDataError,
@@ -14,6 +25,101 @@ from ..utils.exceptions import (
 )
 
 
+_USER_DEFAULTS = {'userId': 'N/A', 'email': 'N/A', 'userStatus': 'N/A', 'enabled': False, 'mfaEnabled': False}
+_get_user_fields = itemgetter('userId', 'email', 'userStatus', 'enabled', 'mfaEnabled')
+
+
+def _format_user_row(user_data: Dict[str, Any]) -> str:
+    """Format one Cognito user as a single multi-line block for list display."""
+    # Required fields come from one default-merged lookup; optional fields render as None
+    # and are dropped by the filter, so each user is one tuple and one join
+    user_id, email, status, enabled, mfa_enabled = _get_user_fields({**_USER_DEFAULTS, **user_data})
+    g = user_data.get
+    phone = g('phone')
+    created = g('userCreateDate')
+    modified = g('userLastModifiedDate')
+    return '\n'.join(filter(None, (
+        f"User ID: {user_id}",
+        f"Email: {email}",
+        f"Phone: {phone}" if phone else None,
+        f"Status: {status}",
+        f"Enabled: {enabled}",
+        f"MFA Enabled: {mfa_enabled}",
+        f"Created: {created}" if created else None,
+        f"Last Modified: {modified}" if modified else None,
+        SEPARATOR
+    )))
+
+
+def _iter_user_lines(data: Dict[str, Any]):
+    """Yield the CLI display lines for a Cognito users list response."""
+    users = data.get('Items', [])
+    
+    yield f"Found {len(users)} Cognito user(s):"
+    yield SEPARATOR
+    
+    yield from map(_format_user_row, users)
+    
+    # Show nextToken for manual pagination
+    next_token = data.get('NextToken')
+    if next_token:
+        yield f"\nNext token: {next_token}"
+        yield "Use --starting-token to get the next page"
+
+
+def format_users_list(data: Dict[str, Any]) -> str:
+    """Format users list for CLI display."""
+    if not data.get('Items'):
+        return "No Cognito users found."
+    
+    # Lines are produced lazily and joined once, without an intermediate list in this module
+    return '\n'.join(_iter_user_lines(data))
+
+
+def _parse_batch_users(batch_file) -> builtin_list:
+    """Read and validate the user list of a create-batch file."""
+    try:
+        entries = loads_json(batch_file.read())
+    except json.JSONDecodeError as e:
+        raise click.BadParameter(f"Invalid JSON in batch file: {e}")
+    
+    if not isinstance(entries, builtin_list) or not entries:
+        raise click.BadParameter("Batch file must contain a non-empty JSON array of users.")
+    
+    users = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get('userId') or not entry.get('email'):
+            raise click.BadParameter(f"Batch entry {index} must be an object with 'userId' and 'email'.")
+        
+        user_data = {'userId': entry['userId'], 'email': entry['email']}
+        if entry.get('phone'):
+            user_data['phone'] = entry['phone']
+        users.append(user_data)
+    
+    return users
+
+
+def _create_batch_user(api_client: APIClient, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Create one user of a batch, capturing a per-user error instead of raising it."""
+    # Infrastructure errors (throttling, expired tokens, API outages) are captured too, so
+    # one failure never aborts the batch without reporting which users were created
+    try:
+        return {'userId': user_data['userId'], 'success': True, 'result': api_client.create_cognito_user(user_data)}
+    except VamsCLIError as e:
+        return {'userId': user_data['userId'], 'success': False, 'error': str(e)}
+
+
+def format_create_batch_result(data: Dict[str, Any]) -> str:
+    """Format create-batch result for CLI display."""
+    lines = [f"  Created: {data['succeeded']} of {data['total']}"]
+    for entry in data['results']:
+        if entry['success']:
+            lines.append(f"  ✓ {entry['userId']}")
+        else:
+            lines.append(f"  ✗ {entry['userId']}: {entry['error']}")
+    return '\n'.join(lines)
+
+
 @click.group()
 def user():
     """User management commands."""
@@ -63,9 +169,7 @@ def list(ctx: click.Context, page_size: Optional[int], max_items: Optional[int],
         vamscli user cognito list --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     # Validate pagination options
     if auto_paginate and starting_token:
@@ -85,109 +189,49 @@ def list(ctx: click.Context, page_size: Optional[int], max_items: Optional[int],
             max_total_items = max_items or 10000
             output_status(f"Retrieving Cognito users (auto-paginating up to {max_total_items} items)...", json_output)
             
-            all_items = []
-            next_token = None
-            total_fetched = 0
-            page_count = 0
+            all_items = []  # Only populated for JSON output
             
-            while True:
-                page_count += 1
-                
-                # Prepare query parameters for this page
-                params = {}
-                if page_size:
-                    params['pageSize'] = page_size
-                if next_token:
-                    params['startingToken'] = next_token
+            for page, page_count, total_fetched, _ in iter_pages(
+                    api_client.list_cognito_users, page_size, max_total_items):
+                items = page.get('Items', [])
                 
-                # Make API call
-                page_result = api_client.list_cognito_users(params)
-                
-                # Aggregate items
-                items = page_result.get('Items', [])
-                all_items.extend(items)
-                total_fetched += len(items)
+                # JSON output needs the full list; CLI output streams each page's rows
+                # as it arrives so memory stays bounded by the page size
+                if json_output:
+                    all_items.extend(items)
+                elif items:
+                    click.echo('\n'.join(map(_format_user_row, items)))
                 
                 # Show progress in CLI mode
                 if not json_output:
                     output_status(f"Fetched {total_fetched} users (page {page_count})...", False)
-                
-                # Check if we should continue
-                next_token = page_result.get('NextToken')
-                if not next_token or total_fetched >= max_total_items:
-                    break
             
             # Create final result
             result = {
                 'Items': all_items,
-                'totalItems': len(all_items),
+                'totalItems': total_fetched,
                 'autoPaginated': True,
                 'pageCount': page_count
             }
             
-            if total_fetched >= max_total_items and next_token:
+            if page.get('NextToken'):
                 result['note'] = f"Reached maximum of {max_total_items} items. More items may be available."
             
+            if not json_output:
+                # Rows were already printed page by page; finish with the summary only
+                if total_fetched:
+                    click.echo('\n'.join(iter_auto_paginate_summary(result)))
+                    click.echo(f"Found {total_fetched} Cognito user(s).")
+                else:
+                    click.echo("No Cognito users found.")
+                return result
+            
         else:
             # Manual pagination mode: single API call
             output_status("Retrieving Cognito users...", json_output)
             
-            # Build pagination parameters
-            params = {}
-            if page_size:
-                params['pageSize'] = page_size
-            if starting_token:
-                params['startingToken'] = starting_token
-            
             # List users
-            result = api_client.list_cognito_users(params)
-        
-        def format_users_list(data):
-            """Format users list for CLI display."""
-            users = data.get('Items', [])
-            if not users:
-                return "No Cognito users found."
-            
-            lines = []
-            
-            # Show auto-pagination info if present
-            if data.get('autoPaginated'):
-                lines.append(f"\nAuto-paginated: Retrieved {data.get('totalItems', 0)} items in {data.get('pageCount', 0)} page(s)")
-                if data.get('note'):
-                    lines.append(f"⚠️  {data['note']}")
-                lines.append("")
-            
-            lines.append(f"Found {len(users)} Cognito user(s):")
-            lines.append("-" * 80)
-            
-            for user_data in users:
-                lines.append(f"User ID: {user_data.get('userId', 'N/A')}")
-                lines.append(f"Email: {user_data.get('email', 'N/A')}")
-                
-                phone = user_data.get('phone')
-                if phone:
-                    lines.append(f"Phone: {phone}")
-                
-                lines.append(f"Status: {user_data.get('userStatus', 'N/A')}")
-                lines.append(f"Enabled: {user_data.get('enabled', False)}")
-                lines.append(f"MFA Enabled: {user_data.get('mfaEnabled', False)}")
-                
-                created = user_data.get('userCreateDate')
-                if created:
-                    lines.append(f"Created: {created}")
-                
-                modified = user_data.get('userLastModifiedDate')
-                if modified:
-                    lines.append(f"Last Modified: {modified}")
-                
-                lines.append("-" * 80)
-            
-            # Show nextToken for manual pagination
-            if not data.get('autoPaginated') and data.get('NextToken'):
-                lines.append(f"\nNext token: {data['NextToken']}")
-                lines.append("Use --starting-token to get the next page")
-            
-            return '\n'.join(lines)
+            result = api_client.list_cognito_users(page_params(page_size, starting_token))
         
         output_result(result, json_output, cli_formatter=format_users_list)
         return result
@@ -206,25 +250,28 @@ def list(ctx: click.Context, page_size: Optional[int], max_items: Optional[int],
 @click.option('-u', '--user-id', required=True, help='User ID (email format)')
 @click.option('-e', '--email', required=True, help='Email address')
 @click.option('-p', '--phone', help='Phone number in E.164 format (e.g., +12345678900)')
+@click.option('--upsert', is_flag=True, help='Update the email/phone of the user if it already exists')
 @click.option('--json-output', is_flag=True, help='Output raw JSON response')
 @click.pass_context
 @requires_setup_and_auth
-def create(ctx: click.Context, user_id: str, email: str, phone: Optional[str], json_output: bool):
+def create(ctx: click.Context, user_id: str, email: str, phone: Optional[str], upsert: bool, json_output: bool):
     """
     Create a new Cognito user.
     
     This command creates a new user in the Cognito user pool. A temporary password
     will be generated by Cognito and returned in the response.
     
+    With --upsert, an existing user is updated with the given email and phone
+    instead of failing, so the same command can be re-run idempotently.
+    
     Examples:
         vamscli user cognito create -u user@example.com -e user@example.com
         vamscli user cognito create -u user@example.com -e user@example.com -p +12345678900
+        vamscli user cognito create -u user@example.com -e user@example.com --upsert
         vamscli user cognito create -u user@example.com -e user@example.com --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Build user data
@@ -239,7 +286,18 @@ def create(ctx: click.Context, user_id: str, email: str, phone: Optional[str], j
         output_status(f"Creating Cognito user '{user_id}'...", json_output)
         
         # Create the user
-        result = api_client.create_cognito_user(user_data)
+        success_message = "✓ Cognito user created successfully!"
+        try:
+            result = api_client.create_cognito_user(user_data)
+        except CognitoUserAlreadyExistsError:
+            if not upsert:
+                raise
+            
+            # Fall through to an update in the same invocation rather than a second command
+            output_status(f"Cognito user '{user_id}' already exists, updating...", json_output)
+            update_data = {key: value for key, value in user_data.items() if key != 'userId'}
+            result = api_client.update_cognito_user(user_id, update_data)
+            success_message = "✓ Cognito user updated successfully!"
         
         def format_create_result(data):
             """Format create result for CLI display."""
@@ -253,7 +311,7 @@ def create(ctx: click.Context, user_id: str, email: str, phone: Optional[str], j
         output_result(
             result,
             json_output,
-            success_message="✓ Cognito user created successfully!",
+            success_message=success_message,
             cli_formatter=format_create_result
         )
         
@@ -285,6 +343,58 @@ def create(ctx: click.Context, user_id: str, email: str, phone: Optional[str], j
         raise click.ClickException(str(e))
 
 
+@cognito.command('create-batch')
+@click.option('-f', '--file', 'batch_file', type=click.File('r'), required=True,
+              help='JSON file containing an array of users: [{"userId", "email", "phone"?}, ...]')
+@click.option('--json-output', is_flag=True, help='Output raw JSON response')
+@click.pass_context
+@requires_setup_and_auth
+def create_batch(ctx: click.Context, batch_file, json_output: bool):
+    """
+    Create multiple Cognito users from a JSON file.
+    
+    The file must contain a JSON array of user objects with 'userId' and 'email'
+    and an optional 'phone'. Users are created with a small number of concurrent
+    requests; a failure for one user does not stop the others, and the command
+    exits with an error if any user could not be created.
+    
+    Examples:
+        vamscli user cognito create-batch -f users.json
+        vamscli user cognito create-batch -f users.json --json-output
+    """
+    users = _parse_batch_users(batch_file)
+    
+    # Setup/auth already validated by decorator
+    api_client = get_api_client_from_context(ctx)
+    
+    output_status(f"Creating {len(users)} Cognito user(s)...", json_output)
+    
+    # There is no batch create endpoint, so requests are fanned out over at most as many
+    # workers as the API client keeps pooled connections; results keep the file order
+    with ThreadPoolExecutor(max_workers=min(HTTP_POOL_MAXSIZE, len(users))) as executor:
+        results = builtin_list(executor.map(partial(_create_batch_user, api_client), users))
+    
+    succeeded = sum(1 for entry in results if entry['success'])
+    result = {
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'results': results
+    }
+    
+    output_result(
+        result,
+        json_output,
+        success_message="✓ Cognito batch create completed!" if not result['failed'] else None,
+        cli_formatter=format_create_batch_result
+    )
+    
+    if result['failed']:
+        raise click.ClickException(f"{result['failed']} of {result['total']} user(s) could not be created.")
+    
+    return result
+
+
 @cognito.command()
 @click.option('-u', '--user-id', required=True, help='User ID to update')
 @click.option('-e', '--email', help='New email address')
@@ -306,9 +416,7 @@ def update(ctx: click.Context, user_id: str, email: Optional[str], phone: Option
         vamscli user cognito update -u user@example.com -e newemail@example.com --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     # Validate that at least one field is provided
     if not email and not phone:
@@ -394,16 +502,13 @@ def delete(ctx: click.Context, user_id: str, confirm: bool, json_output: bool):
         vamscli user cognito delete -u user@example.com --confirm --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Require confirmation for deletion
         if not confirm:
             if json_output:
                 # For JSON output, return error in JSON format
-                import sys
                 error_result = {
                     "error": "Confirmation required",
                     "message": "User deletion requires the --confirm flag",
@@ -419,8 +524,9 @@ def delete(ctx: click.Context, user_id: str, confirm: bool, json_output: bool):
                 click.echo("Use --confirm flag to proceed with deletion.")
                 raise click.ClickException("Confirmation required for user deletion")
         
-        # If --confirm is provided, skip the additional prompt in JSON mode
-        if not json_output:
+        # If --confirm is provided, skip the additional prompt in JSON mode, and when stdin is
+        # not a terminal - scripts that pass --confirm should not block on a prompt they cannot answer
+        if not json_output and stdin_is_interactive():
             # Additional confirmation prompt for safety (CLI mode only)
             click.secho(f"⚠️  You are about to delete user '{user_id}'", fg='red', bold=True)
             click.echo("This action cannot be undone!")
@@ -490,16 +596,13 @@ def reset_password(ctx: click.Context, user_id: str, confirm: bool, json_output:
         vamscli user cognito reset-password -u user@example.com --confirm --json-output
     """
     # Setup/auth already validated by decorator
-    profile_manager = get_profile_manager_from_context(ctx)
-    config = profile_manager.load_config()
-    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    api_client = get_api_client_from_context(ctx)
     
     try:
         # Require confirmation for password reset
         if not confirm:
             if json_output:
                 # For JSON output, return error in JSON format
-                import sys
                 error_result = {
                     "error": "Confirmation required",
                     "message": "Password reset requires the --confirm flag",
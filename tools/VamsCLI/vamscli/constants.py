@@ -154,6 +154,8 @@ RESERVED_PROFILE_NAMES = ["help", "version", "list"]
 # Authentication and API Configuration
 DEFAULT_TIMEOUT = 30
 MAX_AUTH_RETRIES = 3
+HTTP_POOL_CONNECTIONS = 1  # All API calls go to the single API Gateway host
+HTTP_POOL_MAXSIZE = 4  # Keep-alive connections kept open to that host
 MINIMUM_API_VERSION = "2.2"
 API_LOGIN_PROFILE = "/auth/loginProfile"
 API_SECURE_CONFIG = "/secure-config"
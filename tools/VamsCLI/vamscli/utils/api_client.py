@@ -1,12 +1,14 @@
 """API client for VamsCLI."""
 
 import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 from urllib.parse import urljoin
 
 from ..constants import (
-    API_VERSION, DEFAULT_TIMEOUT, MAX_AUTH_RETRIES, MINIMUM_API_VERSION, 
+    API_VERSION, DEFAULT_TIMEOUT, MAX_AUTH_RETRIES, MINIMUM_API_VERSION, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
     API_LOGIN_PROFILE, API_SECURE_CONFIG, API_ASSETS, API_DATABASE_ASSETS, API_DATABASE_ASSET,
     API_CREATE_FOLDER, API_LIST_FILES, API_FILE_INFO, API_MOVE_FILE, API_COPY_FILE,
     API_ARCHIVE_FILE, API_UNARCHIVE_FILE, API_DELETE_ASSET_PREVIEW, 
@@ -35,6 +37,7 @@ from .exceptions import (
     CycleDetectionError, AssetLinkAlreadyExistsError, InvalidRelationshipTypeError, AssetLinkOperationError,
     RateLimitExceededError, RetryExhaustedError
 )
+from .json_output import loads_json
 from .profile import ProfileManager
 from .retry_config import get_retry_config
 
@@ -48,6 +51,17 @@ class APIClient:
         self.session = requests.Session()
         self.session.timeout = DEFAULT_TIMEOUT
         
+        # Reuse keep-alive connections to the API host across requests (e.g. every page of an
+        # auto-paginated listing) so only the first request pays the TCP/TLS handshake
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Serializes auth profile reads with token refresh/re-authentication, so concurrent
+        # requests sharing this client (e.g. batch commands) refresh once and never read
+        # a half-written auth profile
+        self._auth_lock = threading.RLock()
+        
     def _get_headers(self, include_auth: bool = True) -> Dict[str, str]:
         """Get request headers."""
         headers = {
@@ -56,7 +70,8 @@ class APIClient:
         }
         
         if include_auth:
-            auth_profile = self.profile_manager.load_auth_profile()
+            with self._auth_lock:
+                auth_profile = self.profile_manager.load_auth_profile()
             if auth_profile and 'access_token' in auth_profile:
                 headers['Authorization'] = f"Bearer {auth_profile['access_token']}"
                 
@@ -110,7 +125,7 @@ class APIClient:
                     if response.content:
                         # Try to parse as JSON for better formatting
                         try:
-                            response_data = response.json()
+                            response_data = loads_json(response.content)
                         except Exception:
                             # If not JSON, use text
                             response_data = response.text
@@ -168,7 +183,7 @@ class APIClient:
                     )
                 
                 # Try to refresh token or re-authenticate (for Cognito tokens only)
-                if self._try_refresh_token():
+                if self._refresh_auth(headers.get('Authorization')):
                     return self._make_request(
                         method, endpoint, include_auth, retry_count + 1, 
                         throttle_retry_count, **kwargs
@@ -194,7 +209,7 @@ class APIClient:
                         )
                 
                 # For Cognito tokens, try to refresh and retry
-                if self._try_refresh_token():
+                if self._refresh_auth(headers.get('Authorization')):
                     return self._make_request(
                         method, endpoint, include_auth, retry_count + 1, 
                         throttle_retry_count, **kwargs
@@ -280,6 +295,15 @@ class APIClient:
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {e}")
             
+    def _refresh_auth(self, failed_authorization: Optional[str]) -> bool:
+        """Refresh authentication after a rejected request, once across concurrent callers."""
+        with self._auth_lock:
+            # Another thread may have refreshed the token while this request was in flight
+            current_authorization = self._get_headers().get('Authorization')
+            if current_authorization and current_authorization != failed_authorization:
+                return True
+            return self._try_refresh_token()
+    
     def _try_refresh_token(self) -> bool:
         """Try to refresh the authentication token or re-authenticate using saved credentials."""
         from .logging import log_auth_diagnostic, log_config_diagnostic
@@ -3633,7 +3657,7 @@ class APIClient:
         try:
             query_params = params or {}
             response = self.get(API_COGNITO_USERS, include_auth=True, params=query_params)
-            return response.json()
+            return loads_json(response.content)
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 400:
@@ -0,0 +1,96 @@
+"""Shared helpers for VamsCLI command modules."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+# Row separator used by the list formatters
+SEPARATOR = "-" * 80
+
+
+def page_params(page_size: Optional[int], starting_token: Optional[str]) -> Dict[str, Any]:
+    """Build query parameters for one page of a paginated list call."""
+    params = {}
+    if page_size:
+        params['pageSize'] = page_size
+    if starting_token:
+        params['startingToken'] = starting_token
+    return params
+
+
+def iter_pages(fetch: Callable[[Dict[str, Any]], Dict[str, Any]], page_size: Optional[int],
+               max_items: int) -> Iterator[Tuple[Dict[str, Any], int, int, bool]]:
+    """
+    Yield the pages of an auto-paginated list call.
+    
+    Pagination is cursor based (the NextToken is opaque), so pages are still requested
+    one at a time, but the request for the next page is issued before the current page
+    is yielded so that the caller's processing overlaps with the round trip.
+    
+    Args:
+        fetch: API client list method taking the query parameters of one page
+        page_size: Items per page, or None for the API default
+        max_items: Stop once at least this many items have been fetched
+    
+    Yields:
+        (page, page_count, total_fetched, has_more) for each page, where has_more is True
+        when another page follows. A NextToken on the last page means max_items cut the
+        listing short.
+    """
+    page_count = 0
+    total_fetched = 0
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_page = executor.submit(fetch, page_params(page_size, None))
+        
+        while True:
+            page_count += 1
+            
+            # Wait for the in-flight API call
+            page = pending_page.result()
+            total_fetched += len(page.get('Items', []))
+            next_token = page.get('NextToken')
+            has_more = bool(next_token) and total_fetched < max_items
+            
+            # Prefetch the next page before handing this one to the caller
+            if has_more:
+                pending_page = executor.submit(fetch, page_params(page_size, next_token))
+            
+            yield page, page_count, total_fetched, has_more
+            
+            if not has_more:
+                break
+
+
+def iter_auto_paginate_summary(data: Dict[str, Any]) -> Iterator[str]:
+    """Yield the auto-pagination summary lines for an auto-paginated list response."""
+    yield f"\nAuto-paginated: Retrieved {data.get('totalItems', 0)} items in {data.get('pageCount', 0)} page(s)"
+    note = data.get('note')
+    if note:
+        yield f"⚠️  {note}"
+
+
+def format_result_fields(fields: Sequence[Tuple[str, Optional[str], Any]], data: Dict[str, Any]) -> str:
+    """
+    Format a create/update/delete result as indented "Label: value" lines.
+    
+    Args:
+        fields: (label, key, default) in display order. The value is data[key], falling
+            back to default, and a key of None always shows the default. Fields with a
+            None default are optional and left out when the value is empty.
+        data: API response to format
+    
+    Returns:
+        The formatted lines joined with newlines
+    """
+    lines = []
+    for label, key, default in fields:
+        value = data.get(key, default) if key else default
+        if value or default is not None:
+            lines.append(f"  {label}: {value}")
+    return '\n'.join(lines)
+
+
+def stdin_is_interactive() -> bool:
+    """Return True when stdin is a terminal that can answer a confirmation prompt."""
+    return sys.stdin.isatty()
@@ -24,6 +24,19 @@ def get_profile_manager_from_context(ctx: Optional[click.Context] = None) -> Pro
     return ProfileManager(profile_name)
 
 
+def get_api_client_from_context(ctx: click.Context) -> APIClient:
+    """Get the API client for this invocation, creating it once per Click context."""
+    obj = ctx.ensure_object(dict)
+    api_client = obj.get('api_client')
+    if api_client is None:
+        profile_manager = get_profile_manager_from_context(ctx)
+        # requires_setup_and_auth has usually loaded the configuration already
+        config = obj.get('config') or profile_manager.load_config()
+        api_client = APIClient(config['api_gateway_url'], profile_manager)
+        obj['api_client'] = api_client
+    return api_client
+
+
 
 def requires_setup_and_auth(func):
     """
@@ -83,6 +96,11 @@ def requires_setup_and_auth(func):
             # Load configuration
             config = profile_manager.load_config()
             
+            # Keep the validated configuration for this invocation so commands building their
+            # API client from the context do not read and parse the profile again
+            if ctx is not None:
+                ctx.ensure_object(dict)['config'] = config
+            
             # Log configuration in verbose mode (wrapped in try/catch)
             try:
                 if _is_verbose_mode():
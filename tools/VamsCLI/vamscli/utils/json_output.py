@@ -6,14 +6,101 @@ status messages and CLI formatting from polluting JSON output.
 """
 
 import json
+import math
+import re
 import sys
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable, Union
 import click
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import logging for file-only logging (not console)
 from .logging import log_debug, log_info, log_warning, log_error
 
 
+def dumps_json(data: Any, indent: bool = True) -> str:
+    """
+    Serialize data to a JSON string.
+    
+    Uses orjson when it is installed (``pip install "vamscli[performance]"``), which is
+    considerably faster for large paginated results, and falls back to the standard
+    library otherwise. Values orjson cannot serialize (for example non-string dict keys)
+    are also handed to the standard library. Both paths write the same document:
+    non-ASCII text as \\u escapes, so output stays printable on consoles and pipes that
+    are not UTF-8, compact output without spaces, and NaN/Infinity as null.
+    
+    Args:
+        data: The data to serialize
+        indent: Pretty-print with a 2-space indent (True) or emit compact JSON (False)
+    
+    Returns:
+        The JSON document as a string
+    """
+    if HAS_ORJSON:
+        try:
+            document = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+        except TypeError:
+            pass
+        else:
+            # orjson always writes UTF-8; escape non-ASCII text the way the standard library does
+            if document.isascii():
+                return document
+            return _NON_ASCII.sub(_escape_non_ascii, document)
+    
+    options = {'indent': 2} if indent else {'separators': (',', ':')}
+    try:
+        return json.dumps(data, allow_nan=False, **options)
+    except ValueError:
+        # NaN and Infinity are not valid JSON; write them as null like orjson does
+        return json.dumps(_replace_non_finite(data), **options)
+
+
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    """Return the JSON \\u escape of one non-ASCII character, as a surrogate pair outside the BMP."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+    code -= 0x10000
+    return f'\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}'
+
+
+def _replace_non_finite(data: Any) -> Any:
+    """Return a copy of data with NaN and infinite floats replaced by None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _replace_non_finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_replace_non_finite(value) for value in data]
+    return data
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document from a string or UTF-8 bytes.
+    
+    Uses orjson when it is installed and the standard library otherwise. Both raise
+    ``json.JSONDecodeError`` (orjson's error is a subclass) for invalid input, so callers
+    can handle either parser the same way.
+    
+    Args:
+        data: The JSON document to parse
+    
+    Returns:
+        The parsed data
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def output_result(result: Any, json_output: bool, success_message: Optional[str] = None,
                  cli_formatter: Optional[Callable[[Any], str]] = None) -> None:
     """
@@ -58,7 +145,7 @@ def output_result(result: Any, json_output: bool, success_message: Optional[str]
     
     if json_output:
         # Pure JSON output only
-        click.echo(json.dumps(result, indent=2))
+        click.echo(dumps_json(result))
     else:
         # CLI-friendly output
         if success_message:
@@ -72,7 +159,7 @@ def output_result(result: Any, json_output: bool, success_message: Optional[str]
             # Default formatting for dict results
             for key, value in result.items():
                 if isinstance(value, (dict, list)):
-                    click.echo(f"{key}: {json.dumps(value, indent=2)}")
+                    click.echo(f"{key}: {dumps_json(value)}")
                 else:
                     click.echo(f"{key}: {value}")
         elif isinstance(result, list):
@@ -130,7 +217,7 @@ def output_error(error: Exception, json_output: bool,
             "error": str(error),
             "error_type": error.__class__.__name__
         }
-        click.echo(json.dumps(error_data, indent=2))
+        click.echo(dumps_json(error_data))
         
         # Exit immediately in JSON mode to prevent Click from adding duplicate text
         # This ensures pure JSON output as required by Rule 17
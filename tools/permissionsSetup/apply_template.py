@@ -42,17 +42,58 @@ Usage:
 """
 
 import argparse
+import contextlib
+import io
 import json
 import subprocess
 import sys
 import os
+import traceback
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from vamscli.main import main as vamscli_main
+    HAS_VAMSCLI = True
+except ImportError:
+    HAS_VAMSCLI = False
+
+
+# Environment for vamscli subprocesses, built once: the parent environment with
+# UTF-8 stdio so output can always be decoded
+VAMSCLI_ENV = {**os.environ, "PYTHONIOENCODING": "utf-8"}
+
+
+def loads_json(data):
+    """Parse JSON from a str or bytes, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+    invalid input the same way with either parser.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data):
+    """Serialize data to a compact JSON string, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
 
 
 def load_template(template_path):
     """Load a JSON permission template file and return the parsed dict."""
     try:
-        with open(template_path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(template_path, "rb") as f:
+            data = loads_json(f.read())
+    except (FileNotFoundError, IsADirectoryError):
+        print(f"ERROR: Template file not found: {template_path}")
+        sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"ERROR: Invalid JSON in template file '{template_path}': {e}")
         sys.exit(1)
@@ -68,6 +109,28 @@ def load_template(template_path):
     return data
 
 
+def format_constraint_summary(index, constraint):
+    """Format one constraint as a single dry-run summary line."""
+    get = constraint.get
+    perm_summary = ", ".join(
+        f"{p.get('action', '?')}({p.get('type', '?')})" for p in get("groupPermissions", [])
+    )
+    criteria_and = len(get("criteriaAnd", []))
+    criteria_or = len(get("criteriaOr", []))
+    if criteria_and and criteria_or:
+        criteria_str = f"AND:{criteria_and} OR:{criteria_or}"
+    elif criteria_and:
+        criteria_str = f"AND:{criteria_and}"
+    elif criteria_or:
+        criteria_str = f"OR:{criteria_or}"
+    else:
+        criteria_str = "none"
+    return (
+        f"    [{index}] {get('name', 'unnamed')} | {get('objectType', 'unknown')} | "
+        f"{perm_summary} | criteria: {criteria_str}"
+    )
+
+
 def import_constraints(template_data, profile=None, dry_run=False):
     """Import constraints using vamscli role constraint template import.
 
@@ -81,39 +144,27 @@ def import_constraints(template_data, profile=None, dry_run=False):
     role_name = variable_values.get("ROLE_NAME", "unknown")
 
     if dry_run:
-        print(f"\n--- Constraint Import (DRY RUN) ---")
-        print(f"  Template: {template_name}")
-        print(f"  Role: {role_name}")
-        print(f"  Variables: {json.dumps(variable_values)}")
-        print(f"  Constraints to import: {len(constraints)}")
-        for i, c in enumerate(constraints, 1):
-            name = c.get("name", "unnamed")
-            obj_type = c.get("objectType", "unknown")
-            perms = c.get("groupPermissions", [])
-            perm_summary = ", ".join(
-                f"{p.get('action', '?')}({p.get('type', '?')})" for p in perms
-            )
-            criteria_and = len(c.get("criteriaAnd", []))
-            criteria_or = len(c.get("criteriaOr", []))
-            criteria_parts = []
-            if criteria_and > 0:
-                criteria_parts.append(f"AND:{criteria_and}")
-            if criteria_or > 0:
-                criteria_parts.append(f"OR:{criteria_or}")
-            criteria_str = " ".join(criteria_parts) if criteria_parts else "none"
-            print(f"    [{i}] {name} | {obj_type} | {perm_summary} | criteria: {criteria_str}")
+        print(
+            f"\n--- Constraint Import (DRY RUN) ---\n"
+            f"  Template: {template_name}\n"
+            f"  Role: {role_name}\n"
+            f"  Variables: {json.dumps(variable_values)}\n"
+            f"  Constraints to import: {len(constraints)}"
+        )
+        if constraints:
+            print("\n".join(format_constraint_summary(i, c) for i, c in enumerate(constraints, 1)))
         print(f"  [DRY RUN] vamscli role constraint template import -j <template_json>")
         return True
 
     # Serialize and send via CLI
-    template_json = json.dumps(template_data)
+    template_json = dumps_json(template_data)
     args = ["role", "constraint", "template", "import", "-j", template_json, "--json-output"]
     result = run_vamscli(args, profile=profile)
 
     if result.returncode == 0:
         # Parse response for summary
         try:
-            response = json.loads(result.stdout)
+            response = loads_json(result.stdout)
             count = response.get("constraintsCreated", len(constraints))
             msg = response.get("message", "Import successful")
             print(f"    {msg}")
@@ -124,21 +175,70 @@ def import_constraints(template_data, profile=None, dry_run=False):
                 print(f"    {result.stdout.strip()}")
         return True
     else:
-        stderr = result.stderr.strip() if result.stderr else ""
-        stdout = result.stdout.strip() if result.stdout else ""
-        print(f"    ERROR importing constraints: {stderr or stdout}")
+        print(f"    ERROR importing constraints: {command_error_text(result)}")
         return False
 
 
+def run_vamscli_in_process(cmd):
+    """Run a vamscli command line in this interpreter and return a CompletedProcess.
+
+    The command goes through the same entry point and global error handling as the
+    installed `vamscli` script, with stdout/stderr captured and the exit code taken
+    from its SystemExit, so callers can treat the result like a subprocess run. Any
+    other exception is reported the way an interpreter would: its traceback goes to
+    stderr and the return code is 1. KeyboardInterrupt is re-raised once sys.argv
+    and the standard streams are restored.
+    """
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", errors="replace")
+    stderr = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", errors="replace")
+    returncode = 0
+
+    saved_argv = sys.argv
+    sys.argv = cmd
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            vamscli_main()
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=stderr)
+            returncode = 1
+    except KeyboardInterrupt:
+        raise
+    except BaseException:
+        stderr.write(traceback.format_exc())
+        returncode = 1
+    finally:
+        sys.argv = saved_argv
+
+    stdout.flush()
+    stderr.flush()
+    return subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        stdout=stdout.buffer.getvalue().decode("utf-8", errors="replace"),
+        stderr=stderr.buffer.getvalue().decode("utf-8", errors="replace"),
+    )
+
+
 def run_vamscli(args, profile=None, capture_output=True):
-    """Run a vamscli command and return the result."""
+    """Run a vamscli command and return the result.
+
+    When the vamscli package is importable from this interpreter the command runs
+    in-process, which avoids starting a new Python interpreter for every role,
+    constraint and user operation. Otherwise the `vamscli` executable is run.
+    """
     cmd = ["vamscli"]
     if profile:
         cmd.extend(["--profile", profile])
     cmd.extend(args)
 
-    env = os.environ.copy()
-    env["PYTHONIOENCODING"] = "utf-8"
+    if HAS_VAMSCLI and capture_output:
+        return run_vamscli_in_process(cmd)
+
     result = subprocess.run(
         cmd,
         capture_output=capture_output,
@@ -146,11 +246,16 @@ def run_vamscli(args, profile=None, capture_output=True):
         encoding="utf-8",
         errors="replace",
         timeout=60,
-        env=env,
+        env=VAMSCLI_ENV,
     )
     return result
 
 
+def command_error_text(result):
+    """Return the error text of a failed vamscli command: stderr, or stdout if stderr is empty."""
+    return (result.stderr or result.stdout or "").strip()
+
+
 def create_role(role_name, description, mfa_required, profile=None, dry_run=False):
     """Create a role using vamscli."""
     print(f"  Creating role: {role_name}")
@@ -167,11 +272,10 @@ def create_role(role_name, description, mfa_required, profile=None, dry_run=Fals
         print(f"    Role '{role_name}' created successfully.")
         return True
     else:
-        stderr = result.stderr.strip() if result.stderr else ""
-        if "already exists" in stderr.lower() or "already exists" in (result.stdout or "").lower():
+        if "already exists" in (result.stderr or "").lower() or "already exists" in (result.stdout or "").lower():
             print(f"    Role '{role_name}' already exists, continuing.")
             return True
-        print(f"    ERROR creating role: {stderr or result.stdout}")
+        print(f"    ERROR creating role: {command_error_text(result)}")
         return False
 
 
@@ -188,8 +292,7 @@ def delete_role(role_name, profile=None, dry_run=False):
         print(f"    Role '{role_name}' deleted.")
         return True
     else:
-        stderr = result.stderr.strip() if result.stderr else ""
-        print(f"    WARNING deleting role: {stderr or result.stdout}")
+        print(f"    WARNING deleting role: {command_error_text(result)}")
         return False
 
 
@@ -206,8 +309,7 @@ def assign_user_to_role(user_id, role_name, profile=None, dry_run=False):
         print(f"    User '{user_id}' assigned to '{role_name}'.")
         return True
     else:
-        stderr = result.stderr.strip() if result.stderr else ""
-        print(f"    WARNING assigning user: {stderr or result.stdout}")
+        print(f"    WARNING assigning user: {command_error_text(result)}")
         return False
 
 
@@ -220,16 +322,20 @@ def resolve_variables(args):
       3. --var KEY=VALUE (individual overrides)
       4. ROLE_NAME always set from --role-name
     """
+    # Nothing to merge: the role name is the only variable
+    if not (args.variables_file or args.variables or args.var):
+        return {"ROLE_NAME": args.role_name}
+
     var_values = {}
 
     # 1. Load from JSON file
     if args.variables_file:
-        if not os.path.isfile(args.variables_file):
+        try:
+            with open(args.variables_file, "rb") as f:
+                file_vars = loads_json(f.read())
+        except (FileNotFoundError, IsADirectoryError):
             print(f"ERROR: Variables file not found: {args.variables_file}")
             sys.exit(1)
-        try:
-            with open(args.variables_file, encoding="utf-8") as f:
-                file_vars = json.load(f)
         except json.JSONDecodeError as e:
             print(f"ERROR: Invalid JSON in variables file '{args.variables_file}': {e}")
             sys.exit(1)
@@ -241,7 +347,7 @@ def resolve_variables(args):
     # 2. Load from JSON string
     if args.variables:
         try:
-            json_vars = json.loads(args.variables)
+            json_vars = loads_json(args.variables)
         except json.JSONDecodeError as e:
             print(f"ERROR: Invalid JSON in --variables: {e}")
             sys.exit(1)
@@ -252,10 +358,10 @@ def resolve_variables(args):
 
     # 3. Apply individual --var overrides
     for var_str in args.var:
-        if "=" not in var_str:
+        key, sep, value = var_str.partition("=")
+        if not sep:
             print(f"ERROR: --var must be in KEY=VALUE format: '{var_str}'")
             sys.exit(1)
-        key, value = var_str.split("=", 1)
         var_values[key] = value
 
     # 4. Handle ROLE_NAME: --role-name is authoritative
@@ -302,16 +408,18 @@ def apply_template(template_path, var_values, profile=None, dry_run=False,
     if not role_description:
         role_description = f"{template_name} - {role_name}"
 
-    print(f"Template: {template_name} v{template_version}")
-    print(f"Role: {role_name}")
-    print(f"Variables: {var_values}")
     if dry_run:
-        print("MODE: DRY RUN (no changes will be made)")
+        mode = "DRY RUN (no changes will be made)"
     elif delete:
-        print("MODE: DELETE")
+        mode = "DELETE"
     else:
-        print("MODE: CREATE")
-    print()
+        mode = "CREATE"
+    print(
+        f"Template: {template_name} v{template_version}\n"
+        f"Role: {role_name}\n"
+        f"Variables: {var_values}\n"
+        f"MODE: {mode}\n"
+    )
 
     if delete:
         # Delete mode: delete the role only.
@@ -320,10 +428,12 @@ def apply_template(template_path, var_values, profile=None, dry_run=False,
         # needed. Constraints that reference the deleted role's groupId will no
         # longer match any users but are not automatically removed. Use the VAMS UI
         # or vamscli role constraint commands to clean up orphaned constraints.
-        print("--- Deleting Role ---")
-        print("  Note: Constraints with server-generated IDs are not automatically")
-        print("  deleted. Use the VAMS UI or 'vamscli role constraint' commands")
-        print("  to remove orphaned constraints if needed.")
+        print(
+            "--- Deleting Role ---\n"
+            "  Note: Constraints with server-generated IDs are not automatically\n"
+            "  deleted. Use the VAMS UI or 'vamscli role constraint' commands\n"
+            "  to remove orphaned constraints if needed."
+        )
         delete_role(role_name, profile=profile, dry_run=dry_run)
         print("\nDeletion complete.")
         return
@@ -355,16 +465,16 @@ def apply_template(template_path, var_values, profile=None, dry_run=False,
         print(f"\n--- Assigning User ---")
         assign_user_to_role(assign_user, role_name, profile=profile, dry_run=dry_run)
 
-    # Summary
-    print(f"\n{'='*60}")
-    print(f"Template: {template_name}")
-    print(f"Role: {role_name}")
-    print(f"Constraints: {len(constraints)}")
-    if dry_run:
-        print("Status: DRY RUN complete (no changes made)")
-    else:
-        print("Status: Complete")
-    print(f"{'='*60}")
+    # Summary, written as one block
+    status = "DRY RUN complete (no changes made)" if dry_run else "Complete"
+    print(
+        f"\n{'='*60}\n"
+        f"Template: {template_name}\n"
+        f"Role: {role_name}\n"
+        f"Constraints: {len(constraints)}\n"
+        f"Status: {status}\n"
+        f"{'='*60}"
+    )
 
 
 def main():
@@ -478,11 +588,6 @@ See documentation/PermissionsGuide.md for template details and constraint design
 
     args = parser.parse_args()
 
-    # Validate template exists
-    if not os.path.isfile(args.template):
-        print(f"ERROR: Template file not found: {args.template}")
-        sys.exit(1)
-
     # Resolve variables from all input sources
     var_values = resolve_variables(args)
 
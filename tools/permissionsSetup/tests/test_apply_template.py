@@ -0,0 +1,88 @@
+"""Test running vamscli in-process from the permission template applicator."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import apply_template  # noqa: E402
+
+
+CMD = ["vamscli", "role", "list"]
+
+
+def run_with_main(side_effect):
+    """Run CMD in-process with vamscli's entry point replaced by side_effect."""
+    with patch.object(apply_template, "vamscli_main", side_effect=side_effect, create=True):
+        return apply_template.run_vamscli_in_process(CMD)
+
+
+class TestRunVamscliInProcess:
+    """Test the subprocess-style result of an in-process vamscli run."""
+
+    def test_captures_stdout_and_stderr(self):
+        """Test that output written by the command is returned as text."""
+        def main():
+            print("Role: admin ✓")
+            print("warning", file=sys.stderr)
+
+        result = run_with_main(main)
+
+        assert result.args == CMD
+        assert result.returncode == 0
+        assert result.stdout == "Role: admin ✓\n"
+        assert result.stderr == "warning\n"
+
+    @pytest.mark.parametrize("code, returncode", [(None, 0), (0, 0), (2, 2)])
+    def test_system_exit_code(self, code, returncode):
+        """Test that integer and empty exit codes become the return code."""
+        result = run_with_main(SystemExit(code))
+
+        assert result.returncode == returncode
+        assert result.stderr == ""
+
+    def test_system_exit_message(self):
+        """Test that a message exit code goes to stderr with return code 1."""
+        result = run_with_main(SystemExit("Setup required"))
+
+        assert result.returncode == 1
+        assert result.stderr == "Setup required\n"
+
+    def test_uncaught_exception(self):
+        """Test that an uncaught exception is reported as a traceback with return code 1."""
+        def main():
+            print("partial output")
+            raise RuntimeError("boom")
+
+        saved_argv = sys.argv
+        result = run_with_main(main)
+
+        assert result.returncode == 1
+        assert result.stdout == "partial output\n"
+        assert result.stderr.startswith("Traceback (most recent call last):")
+        assert result.stderr.rstrip().endswith("RuntimeError: boom")
+        assert sys.argv is saved_argv
+
+    def test_keyboard_interrupt_propagates(self):
+        """Test that KeyboardInterrupt is re-raised after argv and the streams are restored."""
+        saved_argv = sys.argv
+        saved_stdout, saved_stderr = sys.stdout, sys.stderr
+
+        with pytest.raises(KeyboardInterrupt):
+            run_with_main(KeyboardInterrupt())
+
+        assert sys.argv is saved_argv
+        assert sys.stdout is saved_stdout
+        assert sys.stderr is saved_stderr
+
+    def test_argv_set_for_command(self):
+        """Test that the command line is visible to vamscli as sys.argv."""
+        seen = []
+
+        result = run_with_main(lambda: seen.append(list(sys.argv)))
+
+        assert result.returncode == 0
+        assert seen == [CMD]